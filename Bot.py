@@ -1,64 +1,1962 @@
 #import all library and make sure all requirements is installed successfully 
+# Arya: Only light imports up here—Selenium's driver and waits, BeautifulSoup, requests and pyautogui
+# are imported inside the code that needs them, so importing this file stays fast and has no side effects
 from __future__ import annotations
+import atexit
 import json
 import csv
 import logging
 import os
+import queue
 import random
 import re
+import signal
+import sqlite3
+import sys
+import threading
 import time
-from datetime import datetime, timedelta
-import getpass
+from datetime import datetime
+import heapq
+from collections import deque
+import itertools
+import functools
+import html
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import pandas as pd
-import pyautogui
-import yaml
-from bs4 import BeautifulSoup
-from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.chrome.service import Service as ChromeService
-import webdriver_manager.chrome as ChromeDriverManager
-ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
 
 # Arya: This sets up our logging—super useful for tracking what’s happening!
 log = logging.getLogger(__name__)
 
-def setupLogger() -> None:
-    # Arya: Creating a timestamped log file to save everything
+class JsonLogFormatter(logging.Formatter):
+    # Arya: One JSON object per line; job ID, stage, duration and friends come from `extra=`
+    FIELDS = ("jobID", "stage", "duration", "combo", "outcome", "state", "worker")
+
+    def format(self, record) -> str:
+        entry = {"time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"), "level": record.levelname,
+                 "logger": record.name, "thread": record.threadName, "message": record.getMessage()}
+        entry.update({field: getattr(record, field) for field in self.FIELDS if hasattr(record, field)})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+def setupLogger(options=None) -> logging.handlers.QueueListener:
+    # Arya: Callers only drop records on a queue—formatting and disk I/O happen on the listener's thread
+    import logging.handlers
+
+    class RecordQueueHandler(logging.handlers.QueueHandler):
+        # Arya: The stock prepare() formats the traceback into the message and drops exc_info; we only merge
+        # Arya: the arguments, so tracebacks are formatted by the listener and JSON lines keep their own field
+        def prepare(self, record) -> logging.LogRecord:
+            record = logging.makeLogRecord(record.__dict__)
+            record.msg, record.args = record.getMessage(), None
+            return record
+
+    options = options or {}
     dt: str = datetime.strftime(datetime.now(), "%m_%d_%y %H_%M_%S ")
     if not os.path.isdir('./logs'):
         os.mkdir('./logs')
-    
-    # Arya: Setting up the log format—file output
-    logging.basicConfig(
-        filename=('./logs/' + str(dt) + 'applyJobs.log'),
-        filemode='w',
-        format='%(asctime)s::%(name)s::%(levelname)s::%(message)s',
-        datefmt='./logs/%d-%b-%y %H:%M:%S'
-    )
-    log.setLevel(logging.DEBUG)
-    
-    # Arya: Adding console output so you can watch live
-    c_handler = logging.StreamHandler()
-    c_handler.setLevel(logging.DEBUG)
-    c_format = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', '%H:%M:%S')
-    c_handler.setFormatter(c_format)
-    log.addHandler(c_handler)
+    max_bytes = int(options.get('max_bytes', 10 * 1024 * 1024))
+    backups = int(options.get('backups', 5))
+
+    # Arya: Setting up the log format—file output, rolled over once it reaches max_bytes
+    handlers = []
+    f_handler = logging.handlers.RotatingFileHandler('./logs/' + str(dt) + 'applyJobs.log',
+                                                     maxBytes=max_bytes, backupCount=backups, encoding='utf-8')
+    f_handler.setFormatter(logging.Formatter('%(asctime)s::%(name)s::%(levelname)s::%(message)s',
+                                             '%d-%b-%y %H:%M:%S'))
+    handlers.append(f_handler)
+    if options.get('json', False):
+        j_handler = logging.handlers.RotatingFileHandler('./logs/' + str(dt) + 'applyJobs.jsonl',
+                                                         maxBytes=max_bytes, backupCount=backups, encoding='utf-8')
+        j_handler.setFormatter(JsonLogFormatter())
+        handlers.append(j_handler)
+
+    # Arya: Adding console output so you can watch live—only our own messages, like before
+    if options.get('console', True):
+        c_handler = logging.StreamHandler()
+        c_handler.setLevel(logging.DEBUG)
+        c_handler.addFilter(logging.Filter(__name__))
+        c_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', '%H:%M:%S'))
+        handlers.append(c_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    logging.getLogger().addHandler(RecordQueueHandler(log_queue))
+    log.setLevel(getattr(logging, str(options.get('level', 'DEBUG')).upper(), logging.DEBUG))
+    # Arya: Whatever is still queued at exit gets written before the process goes
+    atexit.register(listener.stop)
+    return listener
+
+class AppliedLedger:
+    # Arya: Persistent record of every job we've touched—SQLite on disk, dict in memory
+    # Arya: Also a cache of what we learned about each job, so overlapping searches don't reopen dead ends
+    APPLIED = "applied"
+    SKIPPED = "skipped"
+    SEEN = "seen"
+    # Arya: How long an outcome stays trusted, in hours—None never expires, 0 means always look again.
+    # Rows from before outcomes were kept are "skipped" (or "seen"); skipped ones get the no_easy_apply TTL,
+    # counted from their `updated` time, unless ttl_hours sets "skipped" itself
+    TTL_HOURS = {"applied": None, "already_applied": None, "no_easy_apply": 24 * 14,
+                 "blacklisted": 24 * 7, "failed": 24, "seen": 0}
+    COLUMNS = {"title": "TEXT", "company": "TEXT", "easy_apply": "INTEGER", "outcome": "TEXT",
+               "checked": "REAL", "seen": "REAL"}
+
+    def __init__(self, path, results_file=None, ttl_hours=None, max_entries=100000) -> None:
+        # Arya: Opening (or creating) the ledger and pulling in anything new from the results CSV
+        self.path = path
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.claimed: set = set()
+        self.ttl: dict = dict(self.TTL_HOURS, **(ttl_hours or {}))
+        self.ttl.setdefault(self.SKIPPED, self.ttl["no_easy_apply"])
+        self.max_entries = int(max_entries or 0)
+        self.db.execute("CREATE TABLE IF NOT EXISTS jobs ("
+                        "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, updated TEXT NOT NULL)")
+        # Arya: Ledgers written before the cache columns existed just get them added
+        present = {row[1] for row in self.db.execute("PRAGMA table_info(jobs)")}
+        for column, kind in self.COLUMNS.items():
+            if column not in present:
+                self.db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self.db.execute("CREATE INDEX IF NOT EXISTS jobs_seen ON jobs (seen)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS combos (position TEXT, location TEXT, seconds REAL, "
+                        "applied INTEGER, dead INTEGER, PRIMARY KEY (position, location))")
+        self.db.commit()
+        if results_file:
+            self.import_results(results_file)
+        self.status: dict = {}
+        self.outcomes: dict = {}
+        # Arya: Legacy rows have no `checked`, so their TTL runs from `updated` (local time, as written)
+        for jobID, status, outcome, checked in self.db.execute(
+                "SELECT job_id, status, outcome, COALESCE(checked, CAST(strftime('%s', updated, 'utc') AS REAL)) "
+                "FROM jobs"):
+            self.status[jobID] = status
+            self.outcomes[jobID] = (outcome or status, checked or 0.0)
+
+    def import_results(self, filename) -> int:
+        # Arya: Only reading the part of the CSV we haven't seen yet—we remember the byte offset
+        if not os.path.isfile(filename):
+            return 0
+        key = "offset:" + os.path.abspath(filename)
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        offset = int(row[0]) if row else 0
+        if offset > os.path.getsize(filename):
+            offset = 0  # Arya: File was truncated or replaced, start over
+        imported = 0
+        with open(filename, 'rb') as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # Arya: Half-written last row, pick it up next time
+                offset += len(raw)
+                fields = next(csv.reader([raw.decode('utf-8', errors='replace')]), [])
+                if len(fields) < 6:
+                    continue
+                timestamp, jobID, attempted, result = fields[0], fields[1], fields[4], fields[5]
+                if result == "True":
+                    self._upsert(jobID, self.APPLIED, timestamp)
+                else:
+                    # Arya: The CSV can't tell a blacklisted job from a failed one, so never overwrite
+                    status = self.SKIPPED if attempted == "False" else self.SEEN
+                    self.db.execute("INSERT OR IGNORE INTO jobs (job_id, status, updated) VALUES (?, ?, ?)",
+                                    (jobID, status, timestamp))
+                imported += 1
+        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(offset)))
+        self.db.commit()
+        if imported:
+            log.info(f"Arya, imported {imported} rows from {filename} into the ledger")
+        return imported
+
+    def _upsert(self, jobID, status, timestamp) -> None:
+        # Arya: An applied job stays applied, whatever happens to it later
+        self.db.execute(
+            "INSERT INTO jobs (job_id, status, updated) VALUES (?, ?, ?) "
+            "ON CONFLICT(job_id) DO UPDATE SET status = excluded.status, updated = excluded.updated "
+            "WHERE jobs.status != ?",
+            (str(jobID), status, timestamp, self.APPLIED))
+
+    def get(self, jobID) -> str | None:
+        return self.status.get(str(jobID))
+
+    def get_meta(self, key) -> str | None:
+        with self.lock:
+            row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value) -> None:
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+            self.db.commit()
+
+    def outcome(self, jobID) -> str | None:
+        # Arya: What we last found out about the job—legacy rows without one fall back to their status
+        jobID = str(jobID)
+        status = self.status.get(jobID)
+        if status is None:
+            return None
+        return self.outcomes.get(jobID, (status, 0.0))[0]
+
+    def is_known(self, jobID) -> bool:
+        # Arya: Applied jobs never need another page load; other outcomes only until their TTL runs out
+        jobID = str(jobID)
+        status = self.status.get(jobID)
+        if status is None:
+            return False
+        if status == self.APPLIED:
+            return True
+        outcome, checked = self.outcomes.get(jobID, (status, 0.0))
+        ttl = self.ttl.get(outcome, 0)
+        return ttl is None or (ttl > 0 and time.time() - checked < ttl * 3600)
+
+    def claim(self, jobID) -> bool:
+        # Arya: With several workers only one may work on a job—False if it's known or someone else has it
+        jobID = str(jobID)
+        with self.lock:
+            if self.is_known(jobID) or jobID in self.claimed:
+                return False
+            self.claimed.add(jobID)
+            return True
+
+    def release(self, jobID) -> None:
+        with self.lock:
+            self.claimed.discard(str(jobID))
+
+    def record(self, jobID, status, outcome=None, title=None, company=None, easy_apply=None) -> None:
+        # Arya: Saving the outcome right away so a crash can't lose it
+        jobID = str(jobID)
+        with self.lock:
+            if self.status.get(jobID) == self.APPLIED:
+                return
+            now = time.time()
+            outcome = outcome or status
+            self.status[jobID] = status
+            self.outcomes[jobID] = (outcome, now)
+            self._upsert(jobID, status, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            self.db.execute("UPDATE jobs SET outcome = ?, checked = ?, seen = ?, title = COALESCE(?, title), "
+                            "company = COALESCE(?, company), easy_apply = COALESCE(?, easy_apply) WHERE job_id = ?",
+                            (outcome, now, now, title, company, easy_apply, jobID))
+            self.db.commit()
+            if self.max_entries and len(self.status) > self.max_entries * 1.1:
+                self.evict()
+
+    def touch(self, jobIDs) -> None:
+        # Arya: Jobs that showed up on a search page again—last-seen only, their TTL still runs from `checked`
+        known = [(time.time(), jobID) for jobID in map(str, jobIDs) if jobID in self.status]
+        if not known:
+            return
+        with self.lock:
+            self.db.executemany("UPDATE jobs SET seen = ? WHERE job_id = ?", known)
+            self.db.commit()
+
+    def evict(self) -> int:
+        # Arya: Back down to max_entries by dropping the jobs not seen for longest—applied ones always stay
+        with self.lock:
+            excess = len(self.status) - self.max_entries
+            if excess <= 0:
+                return 0
+            rows = self.db.execute("SELECT job_id FROM jobs WHERE status != ? ORDER BY COALESCE(seen, 0) LIMIT ?",
+                                   (self.APPLIED, excess)).fetchall()
+            self.db.executemany("DELETE FROM jobs WHERE job_id = ?", rows)
+            self.db.commit()
+            for (jobID,) in rows:
+                self.status.pop(jobID, None)
+                self.outcomes.pop(jobID, None)
+        log.info(f"Arya, dropped {len(rows)} old jobs from the ledger to stay under {self.max_entries}")
+        return len(rows)
+
+    def ids(self, status=None) -> list:
+        with self.lock:
+            return [k for k, v in self.status.items() if status is None or v == status]
+
+    def combo_stats(self) -> dict:
+        # Arya: Time spent and outcomes per (position, location) across all earlier runs
+        with self.lock:
+            rows = self.db.execute("SELECT position, location, seconds, applied, dead FROM combos")
+            return {(p, l): (seconds, applied, dead) for p, l, seconds, applied, dead in rows}
+
+    def add_combo_stats(self, position, location, seconds, applied, dead) -> None:
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO combos (position, location, seconds, applied, dead) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(position, location) DO UPDATE SET seconds = seconds + excluded.seconds, "
+                "applied = applied + excluded.applied, dead = dead + excluded.dead",
+                (position, location, seconds, applied, dead))
+            self.db.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
+
+def parse_title(browserTitle) -> tuple:
+    # Arya: Pulling job and company out of "(3) Job | Company | LinkedIn"—missing parts come back as None
+    def re_extract(text, pattern):
+        target = re.search(pattern, text)
+        if target:
+            target = target.group(1)
+        return target
+
+    parts = (browserTitle or "").split(' | ')
+    job = re_extract(parts[0], r"\(?\d?\)?\s?(\w.*)")
+    company = re_extract(parts[1], r"(\w.*)") if len(parts) > 1 else None
+    return job, company
+
+class ResultsWriter:
+    # Arya: Long-lived results sink—rows are buffered and flushed every N rows or T seconds
+    FIELDS = ['timestamp', 'jobID', 'job', 'company', 'attempted', 'result']
+    SUFFIXES = {'csv': '.csv', 'jsonl': '.jsonl', 'sqlite': '.db'}
+
+    def __init__(self, filename, backend='csv', flush_every=10, flush_interval=30.0, fsync=False) -> None:
+        if backend not in self.SUFFIXES:
+            raise ValueError(f"Arya, unknown results backend: {backend}")
+        self.filename = filename
+        self.backend = backend
+        self.flush_every = max(1, int(flush_every))
+        self.flush_interval = float(flush_interval)
+        self.fsync = fsync
+        self.rows: list = []
+        self.lock = threading.Lock()
+        self.closed = False
+        if backend == 'sqlite':
+            self.db = sqlite3.connect(filename, check_same_thread=False)
+            self.db.execute("CREATE TABLE IF NOT EXISTS results (timestamp TEXT, job_id TEXT, job TEXT, "
+                            "company TEXT, attempted INTEGER, result INTEGER)")
+            self.db.commit()
+        else:
+            self.file = open(filename, 'a', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.file) if backend == 'csv' else None
+        # Arya: Background flusher so rows never sit in memory longer than flush_interval
+        self.stop = threading.Event()
+        if self.flush_interval > 0:
+            threading.Thread(target=self._flush_periodically, daemon=True).start()
+        atexit.register(self.close)
+
+    @classmethod
+    def path_for(cls, filename, backend='csv', path=None) -> str:
+        # Arya: results.path wins; otherwise jsonl/sqlite swap output_filename's extension so they never share the CSV
+        if path:
+            return path
+        if backend == 'csv':
+            return filename
+        return os.path.splitext(filename)[0] + cls.SUFFIXES[backend]
+
+    def write(self, row: list) -> None:
+        with self.lock:
+            if self.closed:
+                raise ValueError("Arya, results writer is already closed")
+            self.rows.append(row)
+            if len(self.rows) >= self.flush_every:
+                self._flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.closed:
+                self._flush()
+
+    def _flush(self) -> None:
+        # Arya: Whole rows go out in one write, so a crash can only lose the buffer, never half a row
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        if self.backend == 'sqlite':
+            self.db.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.db.commit()
+            return
+        if self.backend == 'csv':
+            self.writer.writerows(rows)
+        else:
+            self.file.write("".join(json.dumps(dict(zip(self.FIELDS, row))) + "\n" for row in rows))
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+
+    def _flush_periodically(self) -> None:
+        while not self.stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.closed:
+                return
+            self._flush()
+            self.closed = True
+            self.stop.set()
+            if self.backend == 'sqlite':
+                self.db.close()
+            else:
+                self.file.close()
+
+class Metrics:
+    # Arya: Timing histograms per stage and counters per outcome, shared by every worker
+    # Arya: Exposed as Prometheus text on /metrics and/or written to a JSON snapshot every snapshot_interval seconds
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+    def __init__(self, port=None, snapshot_path=None, snapshot_interval=60.0) -> None:
+        self.histograms: dict = {}
+        self.counters: dict = {}
+        self.gauges: dict = {}
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = float(snapshot_interval)
+        self.stop = threading.Event()
+        self.server = None
+        if port:
+            self.serve(int(port))
+        if snapshot_path and self.snapshot_interval > 0:
+            threading.Thread(target=self._snapshot_periodically, name="metrics-snapshot", daemon=True).start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _key(name, labels) -> tuple:
+        return (name, tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None)))
+
+    def observe(self, stage, seconds, **labels) -> None:
+        key = self._key(stage, labels)
+        with self.lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = {"buckets": [0] * len(self.BUCKETS), "count": 0, "sum": 0.0}
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    hist["buckets"][i] += 1
+                    break
+            hist["count"] += 1
+            hist["sum"] += seconds
+
+    def inc(self, name, amount=1, **labels) -> None:
+        key = self._key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set(self, name, value, **labels) -> None:
+        with self.lock:
+            self.gauges[self._key(name, labels)] = value
+
+    def outcome(self, outcome, **labels) -> None:
+        self.inc("jobs", outcome=outcome, **labels)
+
+    def timer(self, stage, **labels) -> StageTimer:
+        return StageTimer(self, stage, labels)
+
+    @staticmethod
+    def _labels(pairs) -> str:
+        if not pairs:
+            return ""
+        escape = lambda v: v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in pairs) + "}"
+
+    def prometheus(self) -> str:
+        # Arya: Text exposition format—bucket counts are cumulative there, we store them per bucket
+        with self.lock:
+            histograms = {key: dict(value, buckets=list(value["buckets"])) for key, value in self.histograms.items()}
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+        lines = ["# HELP easyapply_stage_seconds Time spent in each bot stage",
+                 "# TYPE easyapply_stage_seconds histogram"]
+        for (stage, pairs), hist in sorted(histograms.items()):
+            labels = (("stage", stage),) + pairs
+            running = 0
+            for bound, count in zip(self.BUCKETS, hist["buckets"]):
+                running += count
+                lines.append(f"easyapply_stage_seconds_bucket{self._labels(labels + (('le', str(bound)),))} {running}")
+            lines.append(f"easyapply_stage_seconds_bucket{self._labels(labels + (('le', '+Inf'),))} {hist['count']}")
+            lines.append(f"easyapply_stage_seconds_sum{self._labels(labels)} {hist['sum']:.6f}")
+            lines.append(f"easyapply_stage_seconds_count{self._labels(labels)} {hist['count']}")
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE easyapply_{name}_total counter")
+            for (counter, pairs), value in sorted(counters.items()):
+                if counter == name:
+                    lines.append(f"easyapply_{name}_total{self._labels(pairs)} {value}")
+        for name in sorted({name for name, _ in gauges}):
+            lines.append(f"# TYPE easyapply_{name} gauge")
+            for (gauge, pairs), value in sorted(gauges.items()):
+                if gauge == name:
+                    lines.append(f"easyapply_{name}{self._labels(pairs)} {value}")
+        lines.append("# TYPE easyapply_start_time_seconds gauge")
+        lines.append(f"easyapply_start_time_seconds {self.started:.3f}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            stages = [dict(dict(pairs), stage=stage, count=hist["count"], sum=round(hist["sum"], 6),
+                           buckets=dict(zip(map(str, self.BUCKETS), hist["buckets"])))
+                      for (stage, pairs), hist in sorted(self.histograms.items())]
+            counters = [dict(dict(pairs), name=name, value=value) for (name, pairs), value in sorted(self.counters.items())]
+            gauges = [dict(dict(pairs), name=name, value=value) for (name, pairs), value in sorted(self.gauges.items())]
+        return {"timestamp": time.time(), "uptime": round(time.time() - self.started, 3),
+                "stages": stages, "counters": counters, "gauges": gauges}
+
+    def write_snapshot(self) -> None:
+        # Arya: Swapped in atomically, so whoever tails the file never reads half a snapshot
+        if not self.snapshot_path:
+            return
+        try:
+            temp = f"{self.snapshot_path}.tmp"
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f)
+            os.replace(temp, self.snapshot_path)
+        except Exception as e:
+            log.debug("Arya, couldn’t write the metrics snapshot: %s", e)
+
+    def _snapshot_periodically(self) -> None:
+        while not self.stop.wait(self.snapshot_interval):
+            self.write_snapshot()
+
+    def serve(self, port) -> None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] == "/metrics":
+                    body, kind = metrics.prometheus(), "text/plain; version=0.0.4"
+                elif self.path.split("?")[0] == "/metrics.json":
+                    body, kind = json.dumps(metrics.snapshot()), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", kind)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+        log.info(f"Arya, metrics at http://127.0.0.1:{self.server.server_port}/metrics")
+
+    def report(self, **labels) -> None:
+        # Arya: One line per stage for the labels given (e.g. a combo)—where did the time go?
+        wanted = set((k, str(v)) for k, v in labels.items())
+        with self.lock:
+            rows = [(stage, hist["count"], hist["sum"]) for (stage, pairs), hist in self.histograms.items()
+                    if wanted <= set(pairs)]
+            outcomes = {}
+            for (name, pairs), value in self.counters.items():
+                if name == "jobs" and wanted <= set(pairs):
+                    outcome = dict(pairs)["outcome"]
+                    outcomes[outcome] = outcomes.get(outcome, 0) + value
+        for stage, count, total in sorted(rows, key=lambda row: -row[2]):
+            log.info(f"Arya, stage '{stage}': {count} calls, {total:.1f}s total, avg {total / count:.2f}s")
+        if outcomes:
+            log.info("Arya, outcomes: " + ", ".join(f"{k} {v}" for k, v in sorted(outcomes.items())))
+
+    def close(self) -> None:
+        if self.stop.is_set():
+            return
+        self.stop.set()
+        self.write_snapshot()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+def timed(stage):
+    # Arya: Decorator for bot and pipeline methods—times the call under `stage`, labelled with the current combo
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.timer(stage, combo=getattr(self, "combo", None)):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+class StageTimer:
+    # Arya: `with metrics.timer("stage"):`—records the time even when the stage raises
+    def __init__(self, metrics, stage, labels) -> None:
+        self.metrics = metrics
+        self.stage = stage
+        self.labels = labels
+
+    def __enter__(self) -> StageTimer:
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        duration = time.perf_counter() - self.started
+        self.metrics.observe(self.stage, duration, **self.labels)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Arya, %s took %.2fs", self.stage, duration,
+                      extra=dict(self.labels, stage=self.stage, duration=round(duration, 4)))
+        return False
+
+class AnswerStore:
+    # Arya: Remembered answers to form questions, matched even when LinkedIn rewords them a bit
+    PLACEHOLDER = "user provided"
+    # Arya: A fuzzy hit may only differ in these—"Java" vs "Python" is a different question, "the" vs "a" isn't
+    STOPWORDS = frozenset("a an the do does did you your have has had are is be been to of in on at for with by "
+                          "and or any this that please currently ever".split())
+
+    def __init__(self, path, threshold=0.8, flush_every=5) -> None:
+        self.path = Path(path)
+        self.threshold = float(threshold)
+        self.flush_every = max(1, int(flush_every))
+        self.answers: dict = {}
+        self.tokens: dict = {}
+        self.index: dict = {}
+        self.pending: list = []
+        self.lock = threading.Lock()
+        if self.path.is_file():
+            with open(self.path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    if row.get('Question'):
+                        self._add(row['Question'], row.get('Answer') or "")
+        else:
+            with open(self.path, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow(["Question", "Answer"])
+        atexit.register(self.flush)
+
+    @staticmethod
+    def normalize(question) -> str:
+        # Arya: Lowercase, numbers become '#', punctuation and extra spaces disappear
+        question = re.sub(r"['’]", "", str(question).lower())
+        question = re.sub(r"\d+(?:[.,]\d+)?", "#", question)
+        question = re.sub(r"[^\w#]+", " ", question)
+        return " ".join(question.split())
+
+    def _add(self, question, answer) -> str:
+        key = self.normalize(question)
+        if key not in self.answers:
+            words = frozenset(key.split())
+            self.tokens[key] = words
+            for word in words:
+                self.index.setdefault(word, set()).add(key)
+        self.answers[key] = answer
+        return key
+
+    def __contains__(self, question) -> bool:
+        return self.normalize(question) in self.answers
+
+    def lookup(self, question, fuzzy=True):
+        # Arya: Exact normalized hit first, then the closest question by token overlap (Jaccard) that only
+        # Arya: adds or drops stopwords
+        # Arya: Under the lock—other workers add() to the same index sets while we walk them
+        key = self.normalize(question)
+        with self.lock:
+            answer = self.answers.get(key)
+            if answer is None:
+                if not fuzzy:
+                    return None
+                words = set(key.split())
+                overlap: dict = {}
+                for word in words:
+                    for candidate in self.index.get(word, ()):
+                        overlap[candidate] = overlap.get(candidate, 0) + 1
+                best, best_score = None, 0.0
+                for candidate, shared in overlap.items():
+                    if not (words ^ self.tokens[candidate]) <= self.STOPWORDS:
+                        continue
+                    score = shared / (len(words) + len(self.tokens[candidate]) - shared)
+                    if score > best_score:
+                        best, best_score = candidate, score
+                if best is None or best_score < self.threshold:
+                    return None
+                answer = self.answers[best]
+        if not answer or answer == self.PLACEHOLDER:
+            return None
+        return answer
+
+    def add(self, question, answer) -> None:
+        # Arya: New questions go to an append journal that's written in batches
+        with self.lock:
+            self._add(question, answer)
+            self.pending.append([question, answer])
+            if len(self.pending) < self.flush_every:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.pending:
+                return
+            rows, self.pending = self.pending, []
+            with open(self.path, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(rows)
+
+class QuestionRules:
+    # Arya: Keyword rules for form questions—lower priority number wins, specific topics before generic "do you"
+    DEFAULT_RULES = [
+        {"match": "phone number", "answer": "{phone_number}", "priority": 5},
+        {"match": "how many", "answer": "1", "priority": 10},
+        {"match": "experience", "answer": "1", "priority": 20},
+        {"match": "sponsor", "answer": "No", "priority": 30},
+        {"match": ["are you legally", "us citizen"], "answer": "Yes", "priority": 40},
+        {"match": "salary", "answer": "{salary}", "priority": 50},
+        {"match": "gender", "answer": "Male", "priority": 60},
+        {"match": "race", "word": True, "answer": "Wish not to answer", "priority": 70},
+        {"match": ["lgbtq", "ethnicity", "nationality"], "answer": "Wish not to answer", "priority": 70},
+        {"match": "government", "answer": "I do not wish to self-identify", "priority": 80},
+        {"match": ["do you ", "have you ", "are you ", "can you"], "answer": "Yes", "priority": 90},
+    ]
+
+    def __init__(self, rules=None) -> None:
+        # Arya: Compiling all keywords into one Aho-Corasick automaton, so one pass over the question checks every rule
+        rules = self.DEFAULT_RULES if rules is None else rules
+        ordered = sorted(enumerate(rules), key=lambda item: (item[1].get("priority", item[0]), item[0]))
+        self.answers: list = [str(rule["answer"]) for _, rule in ordered]
+        self.regexes: list = []
+        self.goto: list = [{}]
+        self.best: list = [None]
+        for index, (_, rule) in enumerate(ordered):
+            if "regex" in rule:
+                self.regexes.append((index, re.compile(rule["regex"], re.IGNORECASE)))
+                continue
+            keywords = rule["match"] if isinstance(rule["match"], list) else [rule["match"]]
+            for keyword in keywords:
+                keyword = self.normalize(keyword)
+                if rule.get("word"):
+                    keyword = " " + keyword.strip() + " "
+                self._add_keyword(keyword, index)
+        self._link()
+
+    @staticmethod
+    def normalize(text) -> str:
+        # Arya: Lowercase with punctuation turned into spaces, keywords get the same treatment
+        return re.sub(r"\W+", " ", str(text).lower())
+
+    def _add_keyword(self, keyword, index) -> None:
+        state = 0
+        for char in keyword:
+            if char not in self.goto[state]:
+                self.goto.append({})
+                self.best.append(None)
+                self.goto[state][char] = len(self.goto) - 1
+            state = self.goto[state][char]
+        if self.best[state] is None or index < self.best[state]:
+            self.best[state] = index
+
+    def _link(self) -> None:
+        # Arya: Breadth-first failure links; each state keeps the best rule of every keyword ending there
+        self.fail: list = [0] * len(self.goto)
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                inherited = self.best[self.fail[child]]
+                if inherited is not None and (self.best[child] is None or inherited < self.best[child]):
+                    self.best[child] = inherited
+
+    def classify(self, question) -> int | None:
+        # Arya: Index of the best rule matching anywhere in the question, or None
+        goto, fail, best_at = self.goto, self.fail, self.best
+        best = None
+        state = 0
+        for char in " " + self.normalize(question) + " ":
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found = best_at[state]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    return best
+        for index, regex in self.regexes:
+            if best is not None and index > best:
+                break
+            if regex.search(question):
+                return index
+        return best
+
+    def answer(self, question, context=None):
+        # Arya: Filling placeholders like {salary} from the bot's settings
+        index = self.classify(question)
+        if index is None:
+            return None
+        template = self.answers[index]
+        placeholder = re.fullmatch(r"\{(\w+)\}", template)
+        if placeholder and context is not None:
+            return context.get(placeholder.group(1))
+        return template.format_map(context or {})
+
+class JobFilter:
+    # Arya: Include/exclude rules on title, company, location and seniority—compiled once, run on search cards
+    FIELDS = ("title", "company", "location", "seniority", "any")
+    # Arya: Cards don't say how senior a job is, so it's read off the title—first level that matches wins
+    SENIORITY = [
+        ("intern", ["intern", "internship", "co-op"]),
+        ("director", ["director", "vp", "vice president", "chief", "head of"]),
+        ("manager", ["manager", "management"]),
+        ("lead", ["lead", "staff", "principal", "architect"]),
+        ("senior", ["senior", "sr", "sr."]),
+        ("junior", ["junior", "jr", "jr.", "entry level", "entry-level", "graduate", "associate"]),
+    ]
+
+    def __init__(self, rules=None) -> None:
+        self.rules: list = []
+        for number, rule in enumerate(rules or []):
+            field = rule.get("field", "any")
+            if field not in self.FIELDS:
+                raise ValueError(f"Arya, unknown filter field '{field}'—use one of {', '.join(self.FIELDS)}")
+            for action in ("include", "exclude"):
+                if not rule.get(action):
+                    continue
+                keywords = rule[action] if isinstance(rule[action], list) else [rule[action]]
+                pattern = "|".join(re.escape(str(k)) for k in keywords)
+                if rule.get("word", False):
+                    pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+                self.rules.append({
+                    "name": rule.get("name") or f"{action} {field}: {', '.join(map(str, keywords))}",
+                    "field": field,
+                    "action": action,
+                    "regex": re.compile(pattern, 0 if rule.get("case", False) else re.IGNORECASE),
+                })
+        self.seniority = [(level, re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, words)) + r")(?!\w)",
+                                             re.IGNORECASE)) for level, words in self.SENIORITY]
+        self.hits: dict = {rule["name"]: 0 for rule in self.rules}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, filters=None, blacklist=None, blackListTitles=None) -> JobFilter:
+        # Arya: The old blacklist settings become rules too—keywords anywhere on the card, and title substrings
+        rules = list(filters or [])
+        if blacklist:
+            rules.append({"name": "blacklist", "field": "any", "exclude": list(blacklist), "word": True})
+        if blackListTitles:
+            rules.append({"name": "blackListTitles", "field": "title", "exclude": list(blackListTitles),
+                          "case": True})
+        return cls(rules)
+
+    def seniority_of(self, title) -> str:
+        return next((level for level, regex in self.seniority if regex.search(title or "")), "mid")
+
+    def check(self, job) -> str | None:
+        # Arya: Name of the rule that rejects the job, or None if it passes—fields we don't know yet are skipped
+        values = {field: job.get(field) or "" for field in ("title", "company", "location")}
+        values["seniority"] = self.seniority_of(values["title"]) if values["title"] else ""
+        values["any"] = job.get("text") or " | ".join(job.get(f) or "" for f in ("title", "company", "location"))
+        includes: dict = {}
+        for rule in self.rules:
+            value = values[rule["field"]]
+            if not value:
+                continue
+            matched = rule["regex"].search(value) is not None
+            if rule["action"] == "exclude" and matched:
+                return self._hit(rule["name"])
+            if rule["action"] == "include":
+                includes.setdefault(rule["field"], []).append((rule["name"], matched))
+        # Arya: With include rules on a field, at least one of them has to match it
+        for field, results in includes.items():
+            if not any(matched for _, matched in results):
+                return self._hit(results[0][0])
+        return None
+
+    def _hit(self, name) -> str:
+        with self.lock:
+            self.hits[name] += 1
+        return name
+
+    def report(self) -> None:
+        for name, hits in sorted(self.hits.items(), key=lambda item: -item[1]):
+            log.info(f"Arya, filter '{name}' rejected {hits} jobs")
+
+class PageSnapshot:
+    # Arya: The current page's HTML, fetched at most once per state and only parsed when someone asks for a tree
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        # Arya: Call after navigating or clicking—the next query fetches a fresh copy
+        self._source = None
+        self._title = None
+        self._soup = None
+
+    @property
+    def source(self) -> str:
+        if self._source is None:
+            self._source = self.browser.page_source
+        return self._source
+
+    @property
+    def title(self) -> str:
+        if self._title is None:
+            self._title = self.browser.title
+        return self._title
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            from bs4 import BeautifulSoup
+            self._soup = BeautifulSoup(self.source, "lxml")
+        return self._soup
+
+    def contains(self, text) -> bool:
+        return text in self.source
+
+    def select(self, selector) -> list:
+        return self.soup.select(selector)
+
+class WaitPolicy:
+    # Arya: One place for waiting—readiness waits end as soon as the page is ready, pacing is the human jitter on top
+    SETTLED_JS = """
+        var quiet = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+        var start = Date.now(), last = start, seen = performance.getEntriesByType('resource').length;
+        var observer = new MutationObserver(function () { last = Date.now(); });
+        observer.observe(document, {childList: true, subtree: true});
+        (function check() {
+            var loaded = performance.getEntriesByType('resource').length;
+            if (loaded !== seen) { seen = loaded; last = Date.now(); }
+            var ready = document.readyState === 'complete' && Date.now() - last >= quiet;
+            if (ready || Date.now() - start >= timeout) { observer.disconnect(); done(ready); }
+            else { setTimeout(check, 50); }
+        })();
+    """
+    SCROLL_JS = """
+        var end = arguments[0], step = arguments[1], quiet = arguments[2], timeout = arguments[3];
+        var done = arguments[arguments.length - 1];
+        var start = Date.now(), last = start, y = 0;
+        var observer = new MutationObserver(function () { last = Date.now(); });
+        observer.observe(document, {childList: true, subtree: true});
+        function finish(ok) { observer.disconnect(); done(ok); }
+        (function next() {
+            window.scrollTo(0, y);
+            var scrolled = Date.now();
+            (function check() {
+                if (Date.now() - start >= timeout) { return finish(false); }
+                if (Date.now() - Math.max(last, scrolled) < quiet) { return setTimeout(check, 50); }
+                y += step;
+                if (y >= end || y > document.documentElement.scrollHeight) { return finish(true); }
+                next();
+            })();
+        })();
+    """
+
+    def __init__(self, browser, timeout=10, quiet=0.25, pacing=None) -> None:
+        self.timeout = float(timeout)
+        self.quiet = float(quiet)
+        self.pacing: dict = {"page": (1.5, 2.9), "action": (0.2, 0.6)}
+        self.pacing.update({k: tuple(v) for k, v in (pacing or {}).items()})
+        self.stats: dict = {}
+        self.attach(browser)
+
+    def attach(self, browser) -> None:
+        # Arya: The JS waits enforce their own deadline, so the driver limit only has to be generous
+        self.browser = browser
+        self.browser.set_script_timeout(max(60, self.timeout * 4))
+
+    def _record(self, name, started, ok) -> bool:
+        elapsed = time.time() - started
+        stat = self.stats.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+        stat["count"] += 1
+        stat["total"] += elapsed
+        stat["max"] = max(stat["max"], elapsed)
+        if not ok:
+            stat["timeouts"] += 1
+        return ok
+
+    def settled(self, name="settled", quiet=None, timeout=None) -> bool:
+        # Arya: Waiting until the DOM stops changing and no new requests start for a quiet period
+        started = time.time()
+        quiet = self.quiet if quiet is None else quiet
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            ok = bool(self.browser.execute_async_script(self.SETTLED_JS, quiet * 1000, timeout * 1000))
+        except Exception as e:
+            log.debug("Arya, settle wait failed: %s", e)
+            ok = False
+        return self._record(name, started, ok)
+
+    def scroll_through(self, name="scroll", end=4000, step=500, quiet=None, timeout=None) -> bool:
+        # Arya: Scrolling down in steps inside the browser, moving on as soon as lazy content stops arriving
+        started = time.time()
+        quiet = self.quiet if quiet is None else quiet
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            ok = bool(self.browser.execute_async_script(self.SCROLL_JS, end, step, quiet * 1000, timeout * 1000))
+        except Exception as e:
+            log.debug("Arya, scroll wait failed: %s", e)
+            ok = False
+        return self._record(name, started, ok)
+
+    def until(self, condition, name="until", timeout=None):
+        # Arya: Any expected_conditions check, with the result handed back (or False on timeout)
+        from selenium.webdriver.support.ui import WebDriverWait
+        started = time.time()
+        try:
+            result = WebDriverWait(self.browser, self.timeout if timeout is None else timeout,
+                                   poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            result = False
+        self._record(name, started, result is not False)
+        return result
+
+    def present(self, locator, name="present", timeout=None):
+        from selenium.webdriver.support import expected_conditions as EC
+        return self.until(EC.presence_of_element_located(locator), name, timeout)
+
+    def clickable(self, element, name="clickable", timeout=None):
+        from selenium.webdriver.support import expected_conditions as EC
+        return self.until(EC.element_to_be_clickable(element), name, timeout)
+
+    def pace(self, kind="action") -> float:
+        # Arya: Human-looking pause, kept apart from readiness so it can be tuned (or zeroed) on its own
+        low, high = self.pacing.get(kind, (0, 0))
+        pause = random.uniform(low, high) if high > 0 else 0.0
+        if pause:
+            time.sleep(pause)
+        self._record("pace:" + kind, time.time() - pause, True)
+        return pause
+
+    def report(self) -> None:
+        for name, stat in sorted(self.stats.items()):
+            log.info(f"Arya, wait '{name}': {stat['count']} waits, avg {stat['total'] / stat['count']:.2f}s, "
+                     f"max {stat['max']:.2f}s, {stat['timeouts']} timeouts")
+
+class RateLimited(Exception):
+    # Arya: Raised when LinkedIn keeps throttling us or a cap won't free up soon—the run stops and resumes later
+    pass
+
+class RateGovernor:
+    # Arya: One place that decides when we may load a page or submit—hourly/daily caps, throttle detection, backoff
+    STATE_KEY = "rate_governor"
+    THROTTLE_URL_RE = re.compile(r"/checkpoint/|/authwall|captcha|/error/429|too-many-requests", re.IGNORECASE)
+    # Arya: Only LinkedIn's own interstitials are matched—job descriptions say "unusual activity" too
+    THROTTLE_TITLE_RE = re.compile(r"^\s*(?:security verification|quick security check|too many requests|"
+                                   r"let[’']s do a quick security check|429[^|]*)\s*(?:\|\s*LinkedIn\s*)?$",
+                                   re.IGNORECASE)
+    ERROR_PAGE_RE = re.compile(r"HTTP ERROR 429|too many requests", re.IGNORECASE)
+    LIMIT_TEXT_RE = re.compile(r"reached (?:the|today[’']s|your) (?:daily )?(?:easy apply )?(?:application )?limit|"
+                               r"application limit", re.IGNORECASE)
+    # Arya: What the page looks like right after a navigation, in one round trip—URL, title, whether a challenge
+    # Arya: widget is on the page, the text of alerts/toasts and, on Chrome's own error page, its text
+    PAGE_STATE_JS = """
+        var url = location.href, body = document.body;
+        var challenge = !!document.querySelector('#captcha-internal, iframe[src*="captcha"], ' +
+            'form[action*="/checkpoint/"], [data-test-id="challenge"], #challenge-form');
+        var notices = Array.prototype.map.call(document.querySelectorAll(
+            '[role="alert"], [role="alertdialog"], .artdeco-toast-item, .artdeco-inline-feedback--error'),
+            function (el) { return el.innerText; }).join('\\n').slice(0, 5000);
+        var error = url.indexOf('chrome-error://') === 0 && body ? body.innerText.slice(0, 2000) : '';
+        return [url, document.title, challenge, notices, error];
+    """
+
+    def __init__(self, page_views_per_hour=300, page_views_per_day=2000, submissions_per_hour=40,
+                 submissions_per_day=200, backoff_base=30, backoff_max=1800, max_backoffs=6, recover_after=10,
+                 max_wait=1800, submit_cooldown=12 * 3600, metrics=None, ledger=None, save_every=10) -> None:
+        self.caps: dict = {"page": (page_views_per_hour, page_views_per_day),
+                           "submit": (submissions_per_hour, submissions_per_day)}
+        self.history: dict = {kind: deque() for kind in self.caps}
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.max_backoffs = int(max_backoffs)
+        self.recover_after = max(1, int(recover_after))
+        self.max_wait = float(max_wait)
+        self.submit_cooldown = float(submit_cooldown)
+        self.metrics = metrics
+        self.level = 0
+        self.clean = 0
+        self.blocked_until: dict = {kind: 0.0 for kind in self.caps}
+        self.lock = threading.Lock()
+        # Arya: Caps, backoff and cooldowns outlive the process in the ledger—RateLimited means "resume later",
+        # Arya: and a restart mustn't wipe the daily counts or the Easy Apply cooldown
+        self.ledger = ledger
+        self.save_every = max(1, int(save_every))
+        self.unsaved = 0
+        if ledger is not None:
+            self.load()
+            atexit.register(self.save)
+
+    def load(self) -> None:
+        try:
+            state = json.loads(self.ledger.get_meta(self.STATE_KEY) or "{}")
+        except (ValueError, sqlite3.Error) as e:
+            log.debug("Arya, couldn’t read the saved rate governor state: %s", e)
+            return
+        now = time.time()
+        with self.lock:
+            for kind in self.caps:
+                saved = state.get("history", {}).get(kind, [])
+                self.history[kind].extend(sorted(t for t in saved if t > now - 86400))
+                self.blocked_until[kind] = float(state.get("blocked_until", {}).get(kind, 0.0))
+            # Arya: Backoff levels wear off while we're not running, one per backoff_max
+            idle = max(0.0, now - float(state.get("saved", now)))
+            self.level = max(0, int(state.get("level", 0)) - int(idle // self.backoff_max))
+        blocked = {kind: until - now for kind, until in self.blocked_until.items() if until > now}
+        if blocked:
+            log.info("Arya, rate governor still blocking " +
+                     ", ".join(f"{kind} for {wait / 60:.0f} minutes" for kind, wait in blocked.items()))
+
+    def save(self) -> None:
+        if self.ledger is None:
+            return
+        with self.lock:
+            self.unsaved = 0
+            state = json.dumps({"history": {kind: list(history) for kind, history in self.history.items()},
+                                "blocked_until": self.blocked_until, "level": self.level, "saved": time.time()})
+        try:
+            self.ledger.set_meta(self.STATE_KEY, state)
+        except sqlite3.Error as e:
+            log.debug("Arya, couldn’t save the rate governor state: %s", e)
+
+    def _wait_for(self, kind, now) -> float:
+        history = self.history[kind]
+        while history and history[0] < now - 86400:
+            history.popleft()
+        wait = self.blocked_until[kind] - now
+        hourly, daily = self.caps[kind]
+        if daily and len(history) >= daily:
+            wait = max(wait, history[-daily] + 86400 - now)
+        if hourly:
+            in_hour = [t for t in itertools.islice(reversed(history), hourly) if t > now - 3600]
+            if len(in_hour) >= hourly:
+                wait = max(wait, in_hour[-1] + 3600 - now)
+        return max(0.0, wait)
+
+    def acquire(self, kind="page") -> float:
+        # Arya: Blocks until a page view (or submission) is allowed; a wait longer than max_wait ends the run instead
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.time()
+                wait = self._wait_for(kind, now)
+                if wait <= 0:
+                    self.history[kind].append(now)
+                    self.unsaved += 1
+                    due = kind == "submit" or self.unsaved >= self.save_every
+                    break
+            if wait > self.max_wait:
+                self.save()
+                raise RateLimited(f"next {kind} allowed in {wait / 60:.0f} minutes, more than max_wait")
+            log.info(f"Arya, rate governor holding {kind} for {wait:.0f}s")
+            time.sleep(wait)
+            waited += wait
+        if due:
+            self.save()
+        if waited and self.metrics is not None:
+            self.metrics.observe("governor_wait", waited, kind=kind)
+        return waited
+
+    def check(self, kind="submit") -> None:
+        # Arya: Raises now, before a whole form gets filled in, when acquire(kind) would end the run anyway
+        with self.lock:
+            wait = self._wait_for(kind, time.time())
+        if wait > self.max_wait:
+            raise RateLimited(f"next {kind} allowed in {wait / 60:.0f} minutes, more than max_wait")
+
+    def detect(self, browser) -> str | None:
+        # Arya: Which throttle signal the current page shows, if any
+        try:
+            url, title, challenge, notices, error = browser.execute_script(self.PAGE_STATE_JS)
+        except Exception as e:
+            log.debug("Arya, couldn’t read the page for throttle signals: %s", e)
+            return None
+        if self.THROTTLE_URL_RE.search(url or ""):
+            return "throttle_url"
+        if challenge or self.THROTTLE_TITLE_RE.search(title or "") or self.ERROR_PAGE_RE.search(error or ""):
+            return "throttle_page"
+        if self.LIMIT_TEXT_RE.search(notices or ""):
+            return "application_limit"
+        return None
+
+    def throttled(self, signal) -> float:
+        # Arya: Each signal in a row doubles the pause; too many in a row and we stop rather than get locked out
+        with self.lock:
+            now = time.time()
+            if signal == "application_limit":
+                self.blocked_until["submit"] = max(self.blocked_until["submit"], now + self.submit_cooldown)
+                pause = self.submit_cooldown
+            else:
+                self.level += 1
+                self.clean = 0
+                pause = min(self.backoff_max, self.backoff_base * 2 ** (self.level - 1)) * random.uniform(0.8, 1.2)
+                for kind in self.blocked_until:
+                    self.blocked_until[kind] = max(self.blocked_until[kind], now + pause)
+            level = self.level
+        self.save()
+        log.info(f"Arya, LinkedIn is throttling us ({signal})—backing off {pause:.0f}s (level {level})")
+        if self.metrics is not None:
+            self.metrics.inc("throttled", signal=signal)
+        if level > self.max_backoffs:
+            raise RateLimited(f"throttled {level} times in a row ({signal})")
+        return pause
+
+    def ok(self) -> None:
+        # Arya: Recovery—every recover_after clean pages take one step of backoff away
+        with self.lock:
+            if self.level:
+                self.clean += 1
+                if self.clean >= self.recover_after:
+                    self.level -= 1
+                    self.clean = 0
+
+    def navigate(self, browser, url) -> float:
+        # Arya: Waits its turn, loads the page and checks it—throttled pages are retried after the backoff
+        while True:
+            self.acquire("page")
+            started = time.perf_counter()
+            browser.get(url)
+            loaded = time.perf_counter() - started
+            signal = self.detect(browser)
+            if signal is None or signal == "application_limit":
+                self.ok()
+                return loaded
+            self.throttled(signal)
+
+def process_tree_rss(pid) -> int | None:
+    # Arya: RSS of a process and everything under it, in bytes—chromedriver, Chrome and each renderer
+    if os.path.isdir("/proc"):
+        children: dict = {}
+        for entry in os.listdir("/proc"):
+            if entry.isdigit():
+                try:
+                    with open(f"/proc/{entry}/stat") as f:
+                        parent = int(f.read().rsplit(")", 1)[1].split()[1])
+                    children.setdefault(parent, []).append(int(entry))
+                except (OSError, ValueError, IndexError):
+                    continue
+        total, stack = 0, [pid]
+        while stack:
+            current = stack.pop()
+            stack.extend(children.get(current, []))
+            try:
+                with open(f"/proc/{current}/status") as f:
+                    total += next((int(line.split()[1]) for line in f if line.startswith("VmRSS:")), 0) * 1024
+            except OSError:
+                continue
+        return total
+    try:
+        import psutil
+        process = psutil.Process(pid)
+        return sum(p.memory_info().rss for p in [process] + process.children(recursive=True))
+    except Exception:
+        return None
+
+class BrowserWatchdog:
+    # Arya: Watches Chrome's memory and how long pages take—says when tabs (or all of Chrome) should be recycled
+    def __init__(self, sample_every=10, tab_rss_mb=1500, driver_rss_mb=3000, max_nav_seconds=12.0,
+                 latency_window=20, recycle_tabs_every=200, metrics=None) -> None:
+        self.sample_every = max(1, int(sample_every))
+        self.tab_rss = float(tab_rss_mb or 0) * 1024 * 1024
+        self.driver_rss = float(driver_rss_mb or 0) * 1024 * 1024
+        self.max_nav_seconds = float(max_nav_seconds or 0)
+        self.latencies: deque = deque(maxlen=max(1, int(latency_window)))
+        self.recycle_tabs_every = int(recycle_tabs_every or 0)
+        self.metrics = metrics
+        self.navigations = 0
+        self.since_recycle = 0
+        self.last_sample = 0
+        self.last_action = None
+
+    def navigated(self, seconds) -> None:
+        self.navigations += 1
+        self.since_recycle += 1
+        self.latencies.append(seconds)
+        if self.metrics is not None:
+            self.metrics.observe("navigation", seconds)
+
+    def check(self, browser) -> tuple | None:
+        # Arya: (kind, reason) when something should be recycled—a tab recycle that didn't help becomes a restart
+        if self.navigations - self.last_sample < self.sample_every:
+            return None
+        self.last_sample = self.navigations
+        try:
+            rss = process_tree_rss(browser.service.process.pid)
+        except Exception:
+            rss = None
+        latency = sum(self.latencies) / len(self.latencies) if len(self.latencies) >= self.latencies.maxlen // 2 else None
+        if self.metrics is not None:
+            if rss is not None:
+                self.metrics.set("browser_rss_bytes", rss)
+            if latency is not None:
+                self.metrics.set("navigation_latency_avg_seconds", round(latency, 4))
+        escalate = "driver" if self.last_action == "tab" else "tab"
+        if rss is not None and self.driver_rss and rss > self.driver_rss:
+            return "driver", f"Chrome uses {rss / 2 ** 20:.0f} MB"
+        if rss is not None and self.tab_rss and rss > self.tab_rss:
+            return escalate, f"Chrome uses {rss / 2 ** 20:.0f} MB"
+        if latency is not None and self.max_nav_seconds and latency > self.max_nav_seconds:
+            return escalate, f"pages take {latency:.1f}s on average"
+        self.last_action = None
+        if self.recycle_tabs_every and self.since_recycle >= self.recycle_tabs_every:
+            return "tab", f"{self.since_recycle} pages since the last recycle"
+        return None
+
+    def recycled(self, kind, reason) -> None:
+        self.last_action = kind
+        self.since_recycle = 0
+        self.latencies.clear()
+        if self.metrics is not None:
+            self.metrics.inc("recycles", kind=kind)
+
+class JobPipeline:
+    # Arya: Discovery and applying, decoupled—search pages load in a background tab while we apply in the main one
+    PAGE_SIZE = 25
+
+    def __init__(self, bot, position, location, run=None, queue_size=50, low_water=10, exhausted_after=2) -> None:
+        self.bot = bot
+        self.run = run
+        self.browser = bot.browser
+        self.metrics = bot.metrics
+        self.combo = bot.combo
+        self.position = position
+        self.location = location
+        self.jobs: queue.Queue = queue.Queue(maxsize=max(queue_size, self.PAGE_SIZE))
+        self.low_water = low_water
+        self.jobs_per_page = run.resume_offset if run is not None else 0
+        self.requested = False
+        # Arya: IDs seen on any page of this combo—pages with nothing new mean LinkedIn has run out
+        self.combo_seen: set = set()
+        self.dry_pages = 0
+        self.exhausted_after = exhausted_after
+        self.exhausted = False
+        self.stats: dict = {"pages": 0, "new_ids": 0, "queued": 0, "max_depth": 0, "depth_total": 0, "takes": 0,
+                            "starved": 0, "starved_seconds": 0.0}
+        self.open_tabs()
+        if run is not None:
+            for jobID in run.resume_jobs[:self.jobs.maxsize]:
+                self.jobs.put_nowait(jobID)
+        self.request_page()
+
+    def open_tabs(self) -> None:
+        self.apply_tab = self.browser.current_window_handle
+        self.browser.switch_to.new_window('tab')
+        self.discovery_tab = self.browser.current_window_handle
+        self.bot.block_resources()
+        self.browser.switch_to.window(self.apply_tab)
+
+    def attach(self, browser) -> None:
+        # Arya: After a browser restart—new tabs, and the search page we were waiting for is requested again
+        self.browser = browser
+        self.open_tabs()
+        if self.requested:
+            self.request_page()
+
+    def recycle_tabs(self) -> None:
+        # Arya: Closing a tab ends its renderer process, which takes everything it leaked along with it
+        old_tabs = (self.apply_tab, self.discovery_tab)
+        self.browser.switch_to.new_window('tab')
+        fresh = self.browser.current_window_handle
+        self.bot.block_resources()
+        for handle in old_tabs:
+            self.browser.switch_to.window(handle)
+            self.browser.close()
+        self.browser.switch_to.window(fresh)
+        self.attach(self.browser)
+
+    def request_page(self) -> None:
+        # Arya: Kicking off the next search page in the discovery tab without waiting for it to load
+        url = self.bot.jobs_search_url(self.position, self.location, self.jobs_per_page)
+        self.bot.governor.acquire("page")
+        self.browser.switch_to.window(self.discovery_tab)
+        self.browser.execute_script("window.location.href = arguments[0];", url)
+        self.browser.switch_to.window(self.apply_tab)
+        self.requested = True
+
+    def check_exhausted(self, cards) -> int:
+        # Arya: An empty page, or one that only repeats cards we already saw, counts as dry
+        new_ids = {card["jobID"] for card in cards} - self.combo_seen
+        self.combo_seen.update(new_ids)
+        self.dry_pages = 0 if new_ids else self.dry_pages + 1
+        if self.dry_pages >= self.exhausted_after:
+            self.exhausted = True
+            log.info(f"Arya, no new jobs on {self.dry_pages} pages in a row—{self.position} looks exhausted")
+        return len(new_ids)
+
+    @timed("search_page")
+    def collect_page(self) -> int:
+        # Arya: Reading the prefetched page, queueing new job IDs and requesting the page after it
+        started = time.time()
+        self.bot.waits.pace("page")
+        self.browser.switch_to.window(self.discovery_tab)
+        try:
+            self.bot.avoid_lock()
+            self.bot.waits.settled("search_page")
+            signal = self.bot.governor.detect(self.browser)
+            if signal is None or signal == "application_limit":
+                if self.browser.execute_script(self.bot.SCROLL_RESULTS_JS):
+                    self.bot.waits.settled("search_results")
+                cards = self.bot.get_job_cards()
+        finally:
+            self.browser.switch_to.window(self.apply_tab)
+            self.bot.page.invalidate()
+        self.requested = False
+        if signal is not None and signal != "application_limit":
+            # Arya: Same page again once the backoff is over—request_page waits for the governor
+            self.bot.governor.throttled(signal)
+            self.request_page()
+            return 0
+        self.bot.governor.ok()
+        new_ids = self.check_exhausted(cards)
+        jobIDs = self.bot.filter_cards(cards)
+        dead = 0
+        if self.bot.prescreener is not None:
+            passed = self.bot.prescreen_jobs(jobIDs)
+            dead = sum(1 for jobID in set(jobIDs) - set(passed)
+                       if self.bot.ledger.outcome(jobID) in ComboRun.DEAD_OUTCOMES)
+            jobIDs = passed
+        if self.run is not None:
+            self.run.record_page(dead)
+        for jobID in jobIDs:
+            self.jobs.put_nowait(jobID)
+        self.stats["pages"] += 1
+        self.stats["new_ids"] += new_ids
+        self.stats["queued"] += len(jobIDs)
+        self.jobs_per_page += self.PAGE_SIZE
+        if self.run is not None and self.bot.checkpoint is not None:
+            self.bot.checkpoint.page(self.run, self.jobs_per_page, jobIDs)
+        if not self.exhausted:
+            self.request_page()
+        log.debug("Arya, discovery queued %s of %s jobs in %.1fs", len(jobIDs), len(cards), time.time() - started)
+        return len(jobIDs)
+
+    def next_job(self):
+        # Arya: Backpressure—we only read another page once the queue has drained below the low-water mark
+        depth = self.jobs.qsize()
+        self.stats["takes"] += 1
+        self.stats["depth_total"] += depth
+        self.stats["max_depth"] = max(self.stats["max_depth"], depth)
+        if not self.requested and not self.exhausted:
+            # Arya: A page read that failed halfway left nothing in flight—ask for the same page again
+            self.request_page()
+        if self.requested and depth <= self.low_water and self.jobs.maxsize - depth >= self.PAGE_SIZE:
+            if depth == 0:
+                self.stats["starved"] += 1
+                started = time.time()
+                self.collect_page()
+                self.stats["starved_seconds"] += time.time() - started
+            else:
+                self.collect_page()
+        try:
+            return self.jobs.get_nowait()
+        except queue.Empty:
+            return None
+
+    def done(self) -> bool:
+        return self.exhausted and self.jobs.empty()
+
+    def close(self) -> None:
+        # Arya: Jobs still queued were never looked at—forgetting them lets a later combo that finds them apply
+        while True:
+            try:
+                self.bot.seen_jobs.discard(self.jobs.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            self.browser.switch_to.window(self.discovery_tab)
+            self.browser.close()
+        finally:
+            self.browser.switch_to.window(self.apply_tab)
+
+    def report(self) -> None:
+        takes = self.stats["takes"] or 1
+        log.info(f"Arya, discovery: {self.stats['pages']} pages scanned, {self.stats['new_ids']} new IDs, "
+                 f"{self.stats['queued']} jobs queued, "
+                 f"queue depth avg {self.stats['depth_total'] / takes:.1f} max {self.stats['max_depth']}, "
+                 f"apply stage starved {self.stats['starved']} times ({self.stats['starved_seconds']:.1f}s)")
+
+class PreScreener:
+    # Arya: Checking job pages over plain HTTP with the browser's cookies, so only promising jobs get a real page load
+    TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+    def __init__(self, base_url="https://www.linkedin.com", workers=4, timeout=10, governor=None) -> None:
+        self.base_url = base_url.rstrip('/')
+        import requests
+        self.timeout = timeout
+        # Arya: Every fetch is a LinkedIn page view too, so it waits for the governor and reports throttling to it
+        self.governor = governor
+        self.throttled = threading.Event()
+        self.lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prescreen")
+
+    def sync_cookies(self, browser) -> None:
+        # Arya: Copying the logged-in session from Selenium—cheap, so we do it before every batch
+        for cookie in browser.get_cookies():
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'),
+                                     path=cookie.get('path', '/'))
+        if "User-Agent" not in self.session.headers or "python" in self.session.headers["User-Agent"]:
+            self.session.headers["User-Agent"] = browser.execute_script("return navigator.userAgent;")
+
+    def parse(self, jobID, page) -> dict:
+        # Arya: Title, and whether the page tells us Easy Apply yes, no, or can't say (None)
+        match = self.TITLE_RE.search(page)
+        title = html.unescape(" ".join(match.group(1).split())) if match else ""
+        if "You applied on" in page:
+            easy_apply = None
+        elif "Easy Apply" in page:
+            easy_apply = True
+        elif "Apply on company website" in page or "apply-link-offsite" in page:
+            easy_apply = False
+        else:
+            easy_apply = None
+        return {"jobID": jobID, "title": title, "easy_apply": easy_apply, "applied": "You applied on" in page}
+
+    def signal(self, response) -> str | None:
+        # Arya: A 429, or a redirect to a checkpoint/authwall, means LinkedIn wants us to slow down
+        if response.status_code == 429:
+            return "http_429"
+        if RateGovernor.THROTTLE_URL_RE.search(response.url or ""):
+            return "throttle_url"
+        return None
+
+    def fetch(self, jobID) -> dict:
+        unknown = {"jobID": jobID, "title": "", "easy_apply": None, "applied": False}
+        # Arya: Once one fetch in the batch was throttled the rest are left to the browser, after the backoff
+        if self.throttled.is_set():
+            return unknown
+        if self.governor is not None:
+            self.governor.acquire("page")
+        try:
+            response = self.session.get(f"{self.base_url}/jobs/view/{jobID}/", timeout=self.timeout)
+        except Exception as e:
+            log.debug("Arya, pre-screen fetch failed for %s: %s", jobID, e)
+            return unknown
+        signal = self.signal(response)
+        if signal is not None:
+            with self.lock:
+                first = not self.throttled.is_set()
+                self.throttled.set()
+            if first and self.governor is not None:
+                self.governor.throttled(signal)
+            return unknown
+        if self.governor is not None:
+            self.governor.ok()
+        try:
+            response.raise_for_status()
+            return self.parse(jobID, response.text)
+        except Exception as e:
+            log.debug("Arya, pre-screen fetch failed for %s: %s", jobID, e)
+            return unknown
+
+    def fetch_all(self, jobIDs) -> list:
+        self.throttled.clear()
+        return list(self.pool.map(self.fetch, jobIDs))
+
+    def close(self) -> None:
+        self.pool.shutdown(wait=False)
+        self.session.close()
+
+class Checkpoint:
+    # Arya: Append-only journal of where the run is, replayed on start so a crash doesn't cost us the hour
+    def __init__(self, path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.done_combos: set = set()
+        self.in_progress: dict = {}
+        finished = self.replay()
+        # Arya: A run that finished cleanly leaves nothing to resume, so the journal starts over
+        self.file = open(path, 'w' if finished else 'a', encoding='utf-8')
+        if not finished and self.file.tell() > 0:
+            self.file.write("\n")  # Arya: Closing off a torn last line so the next event parses
+        if finished:
+            self.done_combos.clear()
+            self.in_progress.clear()
+        elif self.in_progress or self.done_combos:
+            log.info(f"Arya, resuming from {path}: {len(self.done_combos)} combos done, "
+                     f"{len(self.in_progress)} in progress")
+
+    def replay(self) -> bool:
+        # Arya: Rebuilding done combos, page offsets and unfinished jobs; a torn last line is ignored
+        if not os.path.isfile(self.path):
+            return True
+        finished = True
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                combo = (event.get("position"), event.get("location"))
+                kind = event.get("event")
+                finished = kind == "run_done"
+                if kind == "combo":
+                    self.in_progress[combo] = {"offset": 0, "started": event["time"], "elapsed": 0.0,
+                                               "jobs": {}}
+                elif combo in self.in_progress:
+                    state = self.in_progress[combo]
+                    state["elapsed"] = event["time"] - state["started"]
+                    if kind == "page":
+                        state["offset"] = event["offset"]
+                        state["jobs"].update(dict.fromkeys(event["jobs"], True))
+                    elif kind == "job":
+                        state["jobs"].pop(event["jobID"], None)
+                    elif kind == "combo_done":
+                        self.done_combos.add(combo)
+                        del self.in_progress[combo]
+        return finished
+
+    def _write(self, kind, run=None, **fields) -> None:
+        event = {"event": kind, "time": time.time()}
+        if run is not None:
+            event.update(position=run.position, location=run.location)
+        event.update(fields)
+        with self.lock:
+            self.file.write(json.dumps(event) + "\n")
+            self.file.flush()
+
+    def resume(self, combo) -> dict | None:
+        with self.lock:
+            return self.in_progress.pop(combo, None)
+
+    def combo_started(self, run) -> None:
+        self._write("combo", run)
+        # Arya: Writing the resume point back right away, so a second crash still remembers it
+        if run.resume_offset or run.resume_jobs:
+            self._write("page", run, offset=run.resume_offset, jobs=run.resume_jobs)
+
+    def page(self, run, offset, jobIDs) -> None:
+        self._write("page", run, offset=offset, jobs=list(jobIDs))
+
+    def job_done(self, run, jobID) -> None:
+        self._write("job", run, jobID=jobID)
+
+    def combo_done(self, run) -> None:
+        self._write("combo_done", run)
+
+    def run_done(self) -> None:
+        self._write("run_done")
+
+    def close(self) -> None:
+        with self.lock:
+            self.file.close()
+
+class ComboRun:
+    # Arya: One position/location search with its own time budget—cut short when it only turns up dead jobs
+    # Arya: Dead means the job page itself said no—ledger, filter and seen-this-session skips say nothing about the combo
+    DEAD_OUTCOMES = ("no_easy_apply", "already_applied")
+
+    def __init__(self, position, location, budget, dead_limit=25, min_pages=3) -> None:
+        self.position = position
+        self.location = location
+        self.budget = budget
+        self.dead_limit = int(dead_limit or 0)
+        self.min_pages = int(min_pages or 0)
+        self.started = time.time()
+        self.applied = 0
+        self.dead = 0
+        self.failed = 0
+        self.pages = 0
+        # Arya: Filled in when we pick up a combo that was interrupted
+        self.resume_offset = 0
+        self.resume_jobs: list = []
+
+    def record(self, applied, outcome=None) -> None:
+        # Arya: Already applied or non-Easy-Apply jobs count as dead, failed attempts and blacklisted titles don't
+        if applied:
+            self.applied += 1
+        elif outcome in self.DEAD_OUTCOMES:
+            self.dead += 1
+        else:
+            self.failed += 1
+
+    def record_page(self, dead=0) -> None:
+        # Arya: One search page read, with the jobs pre-screening found dead on it
+        self.pages += 1
+        self.dead += dead
+
+    def elapsed(self) -> float:
+        return time.time() - self.started
+
+    def expired(self) -> bool:
+        if self.elapsed() >= self.budget:
+            return True
+        # Arya: Lots of dead jobs and nothing applied—give the time to another combo, but only after a few pages
+        return (bool(self.dead_limit) and self.applied == 0 and self.dead >= self.dead_limit
+                and self.pages >= self.min_pages)
+
+class ComboScheduler:
+    # Arya: Hands out combos best-yield first (applications per minute from earlier runs), new combos lazily
+    PRIOR_APPLIED = 1
+    PRIOR_MINUTES = 10
+
+    def __init__(self, positions, locations, ledger, max_time, min_time=300, limit=500, checkpoint=None,
+                 dead_limit=25, min_pages=3) -> None:
+        self.ledger = ledger
+        self.checkpoint = checkpoint
+        self.run_options: dict = {"dead_limit": dead_limit, "min_pages": min_pages}
+        self.max_time = max_time
+        self.min_time = min(min_time, max_time)
+        self.limit = limit
+        self.lock = threading.Lock()
+        self.prior = self.PRIOR_APPLIED / self.PRIOR_MINUTES
+        wanted = set(itertools.product(positions, locations))
+        # Arya: Interrupted combos go first, combos finished before a crash are not repeated
+        done = checkpoint.done_combos if checkpoint is not None else set()
+        self.resumable: list = [combo for combo in (checkpoint.in_progress if checkpoint else {}) if combo in wanted]
+        self.handed_out = len(done & wanted)
+        self.drained = False
+        wanted -= done
+        self.history = {combo: stats for combo, stats in ledger.combo_stats().items() if combo in wanted}
+        resuming = set(self.resumable)
+        self.known: list = [(-self.score(combo), random.random(), combo) for combo in self.history
+                            if combo not in resuming]
+        heapq.heapify(self.known)
+        # Arya: Never-tried combos come straight off a shuffled product—no list of every pair is built up front
+        self.fresh = (combo for combo in itertools.product(random.sample(positions, len(positions)),
+                                                            random.sample(locations, len(locations)))
+                      if combo in wanted and combo not in self.history and combo not in resuming)
+
+    def score(self, combo) -> float:
+        # Arya: Applications per minute, smoothed so one lucky or unlucky run doesn't decide everything
+        if combo not in self.history:
+            return self.prior
+        seconds, applied, _ = self.history[combo]
+        return (applied + self.PRIOR_APPLIED) / (seconds / 60 + self.PRIOR_MINUTES)
+
+    def budget(self, combo) -> float:
+        # Arya: Full time for promising combos, down to min_time for ones that keep coming up empty
+        return max(self.min_time, self.max_time * min(1.0, self.score(combo) / self.prior))
+
+    def next(self) -> ComboRun | None:
+        with self.lock:
+            if self.handed_out >= self.limit:
+                self.drained = True
+                return None
+            combo = None
+            if self.resumable:
+                combo = self.resumable.pop(0)
+                state = self.checkpoint.resume(combo)
+                run = ComboRun(combo[0], combo[1], max(60, self.budget(combo) - state["elapsed"]), **self.run_options)
+                run.resume_offset = state["offset"]
+                run.resume_jobs = [jobID for jobID in state["jobs"] if not self.ledger.is_known(jobID)]
+                self.handed_out += 1
+                self.checkpoint.combo_started(run)
+                return run
+            if self.known and -self.known[0][0] >= self.prior:
+                combo = heapq.heappop(self.known)[2]
+            else:
+                combo = next(self.fresh, None)
+                if combo is None and self.known:
+                    combo = heapq.heappop(self.known)[2]
+            if combo is None:
+                self.drained = True
+                return None
+            self.handed_out += 1
+            run = ComboRun(combo[0], combo[1], self.budget(combo), **self.run_options)
+            if self.checkpoint is not None:
+                self.checkpoint.combo_started(run)
+            return run
+
+    def finish(self, run) -> None:
+        # Arya: Saving how the combo did so the next run can order by it
+        self.ledger.add_combo_stats(run.position, run.location, run.elapsed(), run.applied, run.dead)
+        if self.checkpoint is not None:
+            self.checkpoint.combo_done(run)
+        log.info(f"Arya, {run.position} in {run.location}: {run.applied} applied, {run.dead} dead, "
+                 f"{run.failed} failed in {run.elapsed() / 60:.1f} of {run.budget / 60:.0f} minutes")
+
+# Arya: Workers start together—one webdriver-manager download and one cache write at a time
+DRIVER_LOCK = threading.Lock()
+
+def resolve_driver_path(cache_path='.chromedriver_path', refresh=False) -> str:
+    # Arya: Asking webdriver-manager (a network round trip) only when the cached driver binary is gone
+    # Arya: refresh=True drops the cached path first—for when Chrome updated and the old driver won't start it
+    with DRIVER_LOCK:
+        if cache_path and refresh and os.path.isfile(cache_path):
+            os.remove(cache_path)
+        if cache_path and os.path.isfile(cache_path):
+            with open(cache_path, encoding='utf-8') as f:
+                cached = f.read().strip()
+            if cached and os.access(cached, os.X_OK):
+                return cached
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        if cache_path:
+            temp = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp, 'w', encoding='utf-8') as f:
+                f.write(path)
+            os.replace(temp, cache_path)
+        return path
+
+def make_shared(filename='output.csv', ledger_path='applied_jobs.db', results=None, qa_threshold=0.8,
+                checkpoint_path='checkpoint.jsonl', metrics=None, governor=None, job_cache=None) -> dict:
+    # Arya: The pieces every worker must share so nobody applies twice or writes over each other
+    # Arya: Only the CSV backend can be replayed into the ledger, the others are written there directly
+    results = results or {}
+    backend = results.get('backend', 'csv')
+    path = ResultsWriter.path_for(filename, backend, results.get('path'))
+    metrics = Metrics(**(metrics or {}))
+    ledger = AppliedLedger(ledger_path, path if backend == 'csv' else None, **(job_cache or {}))
+    return {
+        "ledger": ledger,
+        "results": ResultsWriter(path, backend,
+                                 flush_every=results.get('flush_every', 10),
+                                 flush_interval=results.get('flush_interval', 30),
+                                 fsync=results.get('fsync', False)),
+        "answers": AnswerStore(Path("qa.csv"), threshold=qa_threshold),
+        "seen": set(),
+        "checkpoint": Checkpoint(checkpoint_path) if checkpoint_path else None,
+        "metrics": metrics,
+        "governor": RateGovernor(metrics=metrics, ledger=ledger, **(governor or {})),
+    }
 
 class EasyApplyBot:
     # Arya: Our awesome job application bot—MAX_SEARCH_TIME limits runtime
-    setupLogger()
     MAX_SEARCH_TIME = 60 * 60  # 1 hour for now, originally 10 hours
+    SCROLL_RESULTS_JS = """
+        var list = document.querySelector('.jobs-search-results-list');
+        if (!list) { return false; }
+        for (var y = 300; y < 3000; y += 100) { list.scrollTo(0, y); }
+        return true;
+    """
+    JOB_CARDS_JS = """
+        function text(card, selector) {
+            var el = card.querySelector(selector);
+            return el ? el.innerText.trim() : '';
+        }
+        return Array.prototype.map.call(document.querySelectorAll('div[data-job-id]'), function (card) {
+            var all = card.innerText || '';
+            return {
+                jobID: card.getAttribute('data-job-id'),
+                title: text(card, '.job-card-list__title, .job-card-container__link, a[href*="/jobs/view/"]'),
+                company: text(card, '.job-card-container__primary-description, .artdeco-entity-lockup__subtitle'),
+                location: text(card, '.job-card-container__metadata-item, .artdeco-entity-lockup__caption'),
+                applied: all.split('\\n').some(function (line) { return line.trim() === 'Applied'; }),
+                easyApply: all.indexOf('Easy Apply') !== -1,
+                text: all
+            };
+        });
+    """
+    # Arya: Where the Easy Apply form is, in one call: the step we're on, its inputs and the button that moves it on
+    FORM_PROBE_JS = """
+        var modal = document.querySelector('.jobs-easy-apply-modal, [data-test-modal][role="dialog"]');
+        var body = document.body ? document.body.innerText : '';
+        var result = {state: 'closed', action: null, button: null, follow: null, uploads: {}, errors: [],
+                      heading: '', empty: 0};
+        if (/application was sent/i.test(modal ? modal.innerText : body)) { result.state = 'sent'; return result; }
+        var notices = Array.prototype.map.call(document.querySelectorAll('[role="alert"], .artdeco-toast-item'),
+            function (el) { return el.innerText; }).join('\\n');
+        if (/reached (the|today.s|your) (daily )?(easy apply )?(application )?limit|application limit/i.test(
+                (modal ? modal.innerText : '') + '\\n' + notices)) { result.state = 'limited'; return result; }
+        if (!modal) { return result; }
+        var heading = modal.querySelector('h3, h2');
+        var progress = modal.querySelector('progress, [role="progressbar"]');
+        result.heading = (heading ? heading.innerText.trim() : '') +
+            (progress ? ' ' + (progress.getAttribute('aria-valuenow') || progress.value || '') : '');
+        result.errors = Array.prototype.map.call(modal.querySelectorAll('.artdeco-inline-feedback__message'),
+            function (el) { return el.innerText.trim(); }).filter(function (text) { return text; });
+        [['resume', 'upload-resume'], ['cv', 'upload-cover-letter']].forEach(function (pair) {
+            var input = modal.querySelector('input[type="file"][id*="jobs-document-upload-file-input-' + pair[1] + '"]');
+            if (input && !input.files.length) { result.uploads[pair[0]] = input; }
+        });
+        result.empty = Array.prototype.filter.call(modal.querySelectorAll('.jobs-easy-apply-form-section__grouping'),
+            function (group) {
+                var radios = group.querySelectorAll('input[type="radio"]');
+                if (radios.length) { return !Array.prototype.some.call(radios, function (r) { return r.checked; }); }
+                var input = group.querySelector('input:not([type="hidden"]):not([type="file"]), select, textarea');
+                return input && (!input.value || input.value === 'Select an option');
+            }).length;
+        result.follow = modal.querySelector("label[for='follow-company-checkbox']");
+        var actions = [['submit', 'Submit application'], ['review', 'Review your application'],
+                       ['next', 'Continue to next step']];
+        for (var i = 0; i < actions.length; i++) {
+            var button = modal.querySelector('button[aria-label="' + actions[i][1] + '"]');
+            if (button && !button.disabled) { result.action = actions[i][0]; result.button = button; break; }
+        }
+        result.state = result.errors.length ? 'error'
+            : Object.keys(result.uploads).length ? 'upload'
+            : result.empty ? 'questions'
+            : result.action || 'unknown';
+        return result;
+    """
+    # Arya: Every question on the current form step—label, input type, options, current value and its error
+    FORM_FIELDS_JS = """
+        var modal = document.querySelector('.jobs-easy-apply-modal, [data-test-modal][role="dialog"]') || document;
+        var TEXT = 'input:not([type="hidden"]):not([type="file"]):not([type="radio"]):not([type="checkbox"]), textarea';
+        function line(el) { return el ? (el.innerText || el.textContent || '').trim().split('\\n')[0].trim() : ''; }
+        return Array.prototype.map.call(modal.querySelectorAll('.jobs-easy-apply-form-section__grouping'),
+            function (group, index) {
+                var radios = group.querySelectorAll('input[type="radio"]');
+                var checks = group.querySelectorAll('input[type="checkbox"]');
+                var select = group.querySelector('select'), input = group.querySelector(TEXT);
+                var error = group.querySelector('.artdeco-inline-feedback__message');
+                var field = {index: index, label: line(group.querySelector('legend') || group.querySelector('label')) || line(group),
+                             type: 'none', options: [], value: '', error: error ? error.innerText.trim() : '',
+                             numeric: false};
+                // The parent's text is only a label when the box is alone in it, otherwise it's the whole question
+                function option(box) {
+                    var label = (box.id ? group.querySelector('label[for="' + box.id + '"]') : null) || box.closest('label');
+                    var parent = box.parentNode.querySelectorAll('input').length === 1 ? line(box.parentNode) : '';
+                    var value = box.value && box.value !== 'on' ? box.value : '';
+                    return {value: box.value || '', label: line(label) || value || parent};
+                }
+                if (radios.length) {
+                    field.type = 'radio';
+                    field.options = Array.prototype.map.call(radios, option);
+                    var checked = Array.prototype.filter.call(radios, function (r) { return r.checked; })[0];
+                    field.value = checked ? checked.value : '';
+                } else if (checks.length) {
+                    field.type = 'checkbox';
+                    field.options = Array.prototype.map.call(checks, option);
+                    field.value = Array.prototype.some.call(checks, function (c) { return c.checked; }) ? 'checked' : '';
+                } else if (select) {
+                    field.type = 'select';
+                    field.options = Array.prototype.map.call(select.options, function (o) {
+                        return {value: o.value, label: o.text.trim()};
+                    });
+                    field.value = select.selectedIndex > 0 && select.value !== 'Select an option' ? select.value : '';
+                } else if (input) {
+                    field.type = 'text';
+                    field.value = input.value;
+                    field.numeric = input.type === 'number' || /numeric/.test(input.id || '');
+                }
+                return field;
+            });
+    """
+    # Arya: Writes a batch of answers ({index, type, value, option}) and says per field what went wrong, if anything
+    FORM_APPLY_JS = """
+        var modal = document.querySelector('.jobs-easy-apply-modal, [data-test-modal][role="dialog"]') || document;
+        var groups = modal.querySelectorAll('.jobs-easy-apply-form-section__grouping');
+        var TEXT = 'input:not([type="hidden"]):not([type="file"]):not([type="radio"]):not([type="checkbox"]), textarea';
+        function fire(el, name) { el.dispatchEvent(new Event(name, {bubbles: true})); }
+        return arguments[0].map(function (fill) {
+            var group = groups[fill.index];
+            if (!group) { return 'the field is gone'; }
+            try {
+                if (fill.type === 'radio' || fill.type === 'checkbox') {
+                    var box = group.querySelectorAll('input[type="' + fill.type + '"]')[fill.option];
+                    if (!box) { return 'the option is gone'; }
+                    if (!box.checked) { box.click(); }
+                } else if (fill.type === 'select') {
+                    var select = group.querySelector('select');
+                    select.selectedIndex = fill.option;
+                    fire(select, 'change');
+                } else {
+                    // Frameworks track the native value setter, so assigning .value alone would be undone
+                    var input = group.querySelector(TEXT);
+                    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(input), 'value').set;
+                    input.focus();
+                    setter.call(input, fill.value);
+                    fire(input, 'input');
+                    fire(input, 'change');
+                    input.blur();
+                }
+                return '';
+            } catch (e) {
+                return String(e);
+            }
+        });
+    """
+    # Arya: URL patterns DevTools refuses to fetch, per resource kind we can do without
+    BLOCKED_URLS = {
+        "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*media.licdn.com/dms/image*"],
+        "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+        "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg", "*.wav", "*dms.licdn.com/playlist*"]
+    }
 
     def __init__(self, username, password, phone_number, profile_path=None, salary=None, rate=None,
                  uploads={}, filename='output.csv', blacklist=[],
-                 blackListTitles=[], experience_level=[]) -> None:
+                 blackListTitles=[], experience_level=[], ledger_path='applied_jobs.db', results={},
+                 qa_threshold=0.8, question_rules=None, waits={},
+                 shared=None, pipeline={}, prescreen={}, checkpoint_path='checkpoint.jsonl',
+                 cookies_path='linkedin_cookies.json', driver_cache='.chromedriver_path', browser={},
+                 base_url='https://www.linkedin.com', metrics={}, form_step_limit=15, filters=None,
+                 governor={}, watchdog={}, job_cache={}, combos={}) -> None:
         # Arya: Initializing the bot with your settings—profile_path is now optional!
         log.info("Welcome to Easy Apply Bot, Arya!")
         dirpath: str = os.getcwd()
@@ -81,27 +1979,49 @@ class EasyApplyBot:
         self.salary = salary
         self.rate = rate
         self.profile_path = profile_path if profile_path else os.path.expanduser("~/.config/chrome-profile")
+        # Arya: Workers in a pool hand us one shared ledger, results writer and answer store
+        shared = shared or make_shared(filename, ledger_path, results, qa_threshold, checkpoint_path, metrics,
+                                       governor, job_cache)
+        self.ledger = shared["ledger"]
         past_ids: list | None = self.get_appliedIDs(filename)
         self.appliedJobIDs: list = past_ids if past_ids is not None else []
         self.filename: str = filename
+        self.results = shared["results"]
+        self.seen_jobs: set = shared["seen"]
+        self.checkpoint = shared["checkpoint"]
+        self.metrics = shared["metrics"]
+        self.governor = shared["governor"]
+        self.combo = None
+        self.base_url: str = base_url.rstrip('/')
+        browser = dict(browser or {})
+        self.headless: bool = bool(browser.get('headless', False))
+        self.block: list = [kind for kind in browser.get('block', []) if kind in self.BLOCKED_URLS]
         self.options = self.browser_options()
+        self.driver_cache = driver_cache
         
         # Arya: Starting Chrome with WebDriver
         try:
-            self.browser = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager().install()),
-                options=self.options
-            )
-            self.wait = WebDriverWait(self.browser, 30)
+            self.browser = self.start_browser()
+            self.waits = WaitPolicy(self.browser, **(waits or {}))
+            self.page = PageSnapshot(self.browser)
         except Exception as e:
             log.error(f"Arya, couldn’t start the browser: {str(e)}")
             raise
+        self.watchdog = BrowserWatchdog(metrics=self.metrics, **(watchdog or {}))
+        self.pipeline = None
         
         self.blacklist = blacklist
+        self.filter = JobFilter.from_config(filters, blacklist, blackListTitles)
+        self.pipeline_options: dict = dict(pipeline or {})
+        self.combo_options: dict = dict(combos or {})
+        prescreen = dict(prescreen or {})
+        prescreen.setdefault('base_url', self.base_url)
+        self.prescreener = PreScreener(governor=self.governor, **prescreen) if prescreen.pop('enabled', False) else None
         self.blackListTitles = blackListTitles
-        self.start_linkedin(username, password)
+        self.cookies_path = cookies_path
         self.phone_number = phone_number
         self.experience_level = experience_level
+        self.form_step_limit = max(1, int(form_step_limit))
 
         # Arya: Locators for finding elements on LinkedIn pages
         self.locator = {
@@ -120,32 +2040,24 @@ class EasyApplyBot:
             "multi_select": (By.XPATH, "//*[contains(@id, 'text-entity-list-form-component')]"),
             "text_select": (By.CLASS_NAME, "artdeco-text-input--input"),
             "2fa_oneClick": (By.ID, 'reset-password-submit-button'),
-            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]')
+            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]'),
+            "modal": (By.CLASS_NAME, "jobs-easy-apply-modal")
         }
 
         # Arya: Setting up the Q&A file for form questions
-        self.qa_file = Path("qa.csv")
-        self.answers = {}
-        if self.qa_file.is_file():
-            df = pd.read_csv(self.qa_file)
-            for index, row in df.iterrows():
-                self.answers[row['Question']] = row['Answer']
-        else:
-            df = pd.DataFrame(columns=["Question", "Answer"])
-            df.to_csv(self.qa_file, index=False, encoding='utf-8')
+        self.qa_file = shared["answers"].path
+        self.answers = shared["answers"]
+        self.rules = QuestionRules(question_rules)
+
+        # Arya: Logging in last, now that every locator it needs exists—kept for logging in again after a restart
+        self.credentials = (username, password)
+        self.start_linkedin(username, password)
 
     def get_appliedIDs(self, filename) -> list | None:
-        # Arya: Loading job IDs we’ve already applied to
-        try:
-            df = pd.read_csv(filename,
-                            header=None,
-                            names=['timestamp', 'jobID', 'job', 'company', 'attempted', 'result'],
-                            lineterminator='\n',
-                            encoding='utf-8')
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S")
-            df = df[df['timestamp'] > (datetime.now() - timedelta(days=2))]
-            jobIDs: list = list(df.jobID)
-            log.info(f"Arya, loaded {len(jobIDs)} jobIDs from recent applications")
+        # Arya: Loading job IDs we’ve already applied to—straight from the ledger, no CSV re-read
+        try:
+            jobIDs: list = self.ledger.ids(AppliedLedger.APPLIED)
+            log.info(f"Arya, loaded {len(jobIDs)} applied jobIDs from the ledger")
             return jobIDs
         except Exception as e:
             log.info(f"Arya, failed to load jobIDs from {filename}: {str(e)}")
@@ -153,8 +2065,16 @@ class EasyApplyBot:
 
     def browser_options(self):
         # Arya: Setting up Chrome options to avoid detection
+        from selenium import webdriver
         options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
+        if self.headless:
+            # Arya: No window at all—a fixed viewport keeps LinkedIn's desktop layout, no display needed
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--mute-audio")
+        else:
+            options.add_argument("--start-maximized")
         options.add_argument("--ignore-certificate-errors")
         options.add_argument('--no-sandbox')
         options.add_argument("--disable-extensions")
@@ -163,186 +2083,369 @@ class EasyApplyBot:
         # Arya: Using profile_path if provided
         if self.profile_path:
             options.add_argument(f"--user-data-dir={self.profile_path}")
+        # Arya: Images are cheapest to skip before they're even requested—fonts and media go through DevTools
+        if "images" in self.block:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            options.add_argument("--blink-settings=imagesEnabled=false")
         return options
 
+    def start_browser(self):
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        try:
+            self.browser = webdriver.Chrome(
+                service=ChromeService(resolve_driver_path(self.driver_cache)),
+                options=self.options
+            )
+        except SessionNotCreatedException as e:
+            if not self.driver_cache:
+                raise
+            # Arya: Usually Chrome auto-updated past the cached chromedriver—fetch a matching one and try once more
+            log.info(f"Arya, cached chromedriver couldn’t start Chrome ({str(e).splitlines()[0]}), fetching a new one")
+            self.browser = webdriver.Chrome(
+                service=ChromeService(resolve_driver_path(self.driver_cache, refresh=True)),
+                options=self.options
+            )
+        self.block_resources()
+        if self.block:
+            log.info(f"Arya, blocking {', '.join(self.block)} to save bandwidth")
+        return self.browser
+
+    def restart_browser(self) -> None:
+        # Arya: A fresh Chrome on the same profile—the saved cookies log it back in if the profile alone doesn't
+        self.save_session()
+        try:
+            self.browser.quit()
+        except Exception as e:
+            log.debug("Arya, old browser didn’t quit cleanly: %s", e)
+        self.start_browser()
+        self.waits.attach(self.browser)
+        self.page.browser = self.browser
+        self.page.invalidate()
+        self.start_linkedin(*self.credentials)
+        if self.pipeline is not None:
+            self.pipeline.attach(self.browser)
+
+    def recycle(self) -> None:
+        # Arya: Called between jobs—fresh tabs when Chrome gets heavy or slow, a fresh Chrome if that wasn't enough
+        action = self.watchdog.check(self.browser)
+        if action is None:
+            return
+        kind, reason = action
+        log.info(f"Arya, recycling the {kind} ({reason})")
+        try:
+            if kind == "driver":
+                self.restart_browser()
+            elif self.pipeline is not None:
+                self.pipeline.recycle_tabs()
+            else:
+                self.browser.switch_to.new_window('tab')
+                fresh = self.browser.current_window_handle
+                self.block_resources()
+                for handle in [h for h in self.browser.window_handles if h != fresh]:
+                    self.browser.switch_to.window(handle)
+                    self.browser.close()
+                self.browser.switch_to.window(fresh)
+            self.page.invalidate()
+        finally:
+            self.watchdog.recycled(kind, reason)
+
+    def block_resources(self) -> None:
+        # Arya: Telling Chrome not to fetch the resource kinds listed under browser.block
+        # Arya: The block list is per tab, so every new tab needs this call too
+        patterns = [pattern for kind in self.block for pattern in self.BLOCKED_URLS[kind]]
+        if not patterns:
+            return
+        try:
+            self.browser.execute_cdp_cmd("Network.enable", {})
+            self.browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            log.debug("Arya, blocking %s in this tab to save bandwidth", ", ".join(self.block))
+        except Exception as e:
+            log.debug("Arya, couldn’t set up resource blocking: %s", e)
+
     def start_linkedin(self, username, password) -> None:
-        # Arya: Logging into LinkedIn—let’s get in there!
+        # Arya: Logging into LinkedIn—reusing the last session when it's still good, the login form otherwise
+        if self.restore_session():
+            log.info("Arya, session still valid—skipped the login form!")
+            return
         log.info("Arya, logging in—please wait :)")
-        self.browser.get("https://www.linkedin.com/login?trk=guest_homepage-basic_nav-header-signin")
+        self.browser.get(self.base_url + "/login?trk=guest_homepage-basic_nav-header-signin")
         try:
-            user_field = self.browser.find_element("id", "username")
+            user_field = self.waits.present((By.ID, "username"), "login_form")
+            if user_field is False:
+                raise TimeoutException("login form never showed up")
             pw_field = self.browser.find_element("id", "password")
             login_button = self.browser.find_element("xpath",
                         '//*[@id="organic-div"]/form/div[3]/button')
             user_field.send_keys(username)
             user_field.send_keys(Keys.TAB)
-            time.sleep(2)
+            self.waits.pace("action")
             pw_field.send_keys(password)
-            time.sleep(2)
+            self.waits.pace("action")
             login_button.click()
-            time.sleep(15)
-            # Arya: Handling 2FA if it pops up
-            if self.is_present(self.locator["2fa_oneClick"]):
-                oneclick_auth = self.browser.find_element(by='id', value='reset-password-submit-button')
-                if oneclick_auth is not None:
-                    log.info("Arya, 2FA needed—sleeping 15s for you to handle")
-                    time.sleep(15)
+            # Arya: Done as soon as the feed loads; 2FA or a checkpoint page gives you two minutes to handle it
+            self.waits.until(lambda driver: not self.on_login_page() or self.is_present(self.locator["2fa_oneClick"])
+                             or "checkpoint" in driver.current_url, "login_submit", timeout=30)
+            if self.is_present(self.locator["2fa_oneClick"]) or "checkpoint" in self.browser.current_url:
+                log.info("Arya, 2FA needed—waiting up to 2 minutes for you to handle")
+                self.waits.until(lambda driver: "/feed" in driver.current_url, "login_2fa", timeout=120)
+            if self.on_login_page():
+                log.error("Arya, still on the login page—check your credentials")
+                return
+            self.save_session()
             log.info("Arya, we’re logged in!")
         except TimeoutException:
             log.info("Arya, timeout—couldn’t find login fields!")
 
+    def on_login_page(self) -> bool:
+        url = self.browser.current_url
+        return any(part in url for part in ("/login", "/uas/", "/authwall", "/checkpoint"))
+
+    def restore_session(self) -> bool:
+        # Arya: The profile dir may already be logged in; if not, we try the cookies saved last time
+        self.browser.get(self.base_url + "/feed/")
+        if not self.on_login_page():
+            return True
+        if not self.cookies_path or not os.path.isfile(self.cookies_path):
+            return False
+        try:
+            with open(self.cookies_path, encoding='utf-8') as f:
+                cookies = json.load(f)
+            now = time.time()
+            for cookie in cookies:
+                if cookie.get("expiry") and cookie["expiry"] < now:
+                    continue
+                cookie.pop("sameSite", None)
+                self.browser.add_cookie(cookie)
+        except Exception as e:
+            log.debug("Arya, couldn’t restore saved cookies: %s", e)
+            return False
+        self.browser.get(self.base_url + "/feed/")
+        return not self.on_login_page()
+
+    def save_session(self) -> None:
+        # Arya: Cookies are a login—written owner-only and swapped in atomically, each worker via its own temp file
+        if not self.cookies_path:
+            return
+        try:
+            temp = f"{self.cookies_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+            with open(os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+                json.dump(self.browser.get_cookies(), f)
+            os.replace(temp, self.cookies_path)
+        except Exception as e:
+            log.debug("Arya, couldn’t save cookies: %s", e)
+
     def fill_data(self) -> None:
-        # Arya: Minimizing the window so it’s out of your way
+        # Arya: Minimizing the window so it’s out of your way—headless has no window to move
+        if self.headless:
+            return
         self.browser.set_window_size(1, 1)
         self.browser.set_window_position(2000, 2000)
 
-    def start_apply(self, positions, locations) -> None:
-        # Arya: Starting the job application process—here we go!
+    def start_apply(self, positions, locations, combos=None) -> None:
+        # Arya: Starting the job application process—here we go! Pool workers pass in a shared scheduler
         start: float = time.time()
         self.fill_data()
         self.positions = positions
         self.locations = locations
-        combos: list = []
-        while len(combos) < len(positions) * len(locations):
-            position = positions[random.randint(0, len(positions) - 1)]
-            location = locations[random.randint(0, len(locations) - 1)]
-            combo: tuple = (position, location)
-            if combo not in combos:
-                combos.append(combo)
-                log.info(f"Arya, targeting {position} in {location}")
-                location = "&location=" + location
-                self.applications_loop(position, location)
-            if len(combos) > 500:
+        pooled = combos is not None
+        if combos is None:
+            combos = ComboScheduler(positions, locations, self.ledger, self.MAX_SEARCH_TIME,
+                                    checkpoint=self.checkpoint, **self.combo_options)
+        while True:
+            run = combos.next()
+            if run is None:
+                # Arya: A finished run leaves nothing to resume—the pool marks this itself once every worker is done
+                if not pooled and self.checkpoint is not None:
+                    self.checkpoint.run_done()
                 break
+            log.info(f"Arya, targeting {run.position} in {run.location} for up to {run.budget // 60:.0f} minutes")
+            location = "&location=" + run.location
+            try:
+                self.applications_loop(run.position, location, run)
+            except RateLimited as e:
+                # Arya: Not finishing the combo leaves it in the journal, so the next start picks it up again
+                log.error(f"Arya, stopping for now—{str(e)}")
+                return
+            combos.finish(run)
 
-    def applications_loop(self, position, location):
-        # Arya: Looping through job listings to find matches
-        count_application = 0
-        count_job = 0
-        jobs_per_page = 0
-        start_time: float = time.time()
+    def applications_loop(self, position, location, run=None):
+        # Arya: Looping through job listings to find matches—discovery feeds a queue, we apply from it
+        run = run or ComboRun(position, location, self.MAX_SEARCH_TIME)
+        self.combo = f"{run.position} | {run.location}"
 
         log.info("Arya, searching for jobs—be patient!")
-        self.browser.set_window_position(1, 1)
-        self.browser.maximize_window()
-        self.browser, _ = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level)
+        if not self.headless:
+            self.browser.set_window_position(1, 1)
+            self.browser.maximize_window()
+        pipeline = JobPipeline(self, position, location, run=run, **self.pipeline_options)
+        self.pipeline = pipeline
         log.info("Arya, still hunting—hold on!")
 
-        while time.time() - start_time < self.MAX_SEARCH_TIME:
-            try:
-                log.info(f"Arya, {(self.MAX_SEARCH_TIME - (time.time() - start_time)) // 60} minutes remaining")
-                randoTime: float = random.uniform(1.5, 2.9)
-                log.debug(f"Arya, pausing for {round(randoTime, 1)}s to seem human")
-                time.sleep(randoTime)
-                self.load_page(sleep=0.5)
-
-                # Arya: Scrolling to load all jobs
-                if self.is_present(self.locator["search"]):
-                    scrollresults = self.get_elements("search")
-                    for i in range(300, 3000, 100):
-                        self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i), scrollresults[0])
-                    scrollresults = self.get_elements("search")
-                    time.sleep(1)
-
-                # Arya: Gathering job links
-                if self.is_present(self.locator["links"]):
-                    links = self.get_elements("links")
-                    jobIDs = {}
-                    for link in links:
-                        if 'Applied' not in link.text:
-                            if link.text not in self.blacklist:
-                                jobID = link.get_attribute("data-job-id")
-                                if jobID == "search":
-                                    log.debug(f"Arya, got 'search' instead of jobID: {link.text}")
-                                    continue
-                                else:
-                                    jobIDs[jobID] = "To be processed"
-                    if len(jobIDs) > 0:
-                        self.apply_loop(jobIDs)
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                    location,
-                                                                    jobs_per_page, 
-                                                                    experience_level=self.experience_level)
-                else:
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                    location,
-                                                                    jobs_per_page, 
-                                                                    experience_level=self.experience_level)
-            except Exception as e:
-                log.error(f"Arya, hit an issue in the loop: {str(e)}")
+        last_report: float = 0
+        try:
+            while not run.expired() and not pipeline.done():
+                try:
+                    if time.time() - last_report >= 60:
+                        log.info(f"Arya, {(run.budget - run.elapsed()) // 60} minutes remaining")
+                        last_report = time.time()
+                    jobID = pipeline.next_job()
+                    if jobID is not None:
+                        run.record(self.apply_one(jobID), self.ledger.outcome(jobID))
+                        if self.checkpoint is not None:
+                            self.checkpoint.job_done(run, jobID)
+                        self.recycle()
+                except RateLimited:
+                    raise
+                except Exception as e:
+                    log.error(f"Arya, hit an issue in the loop: {str(e)}")
+                    self.metrics.inc("errors", stage="applications_loop", combo=self.combo)
+        finally:
+            pipeline.close()
+            self.pipeline = None
+        pipeline.report()
+        self.waits.report()
+        self.filter.report()
+        self.metrics.report(combo=self.combo)
 
-    def apply_loop(self, jobIDs):
-        # Arya: Applying to each job one by one
-        for jobID in jobIDs:
-            if jobIDs[jobID] == "To be processed":
-                applied = self.apply_to_job(jobID)
-                if applied:
-                    log.info(f"Arya, applied to {jobID}")
+    def filter_cards(self, cards) -> list:
+        # Arya: Turning job cards into IDs worth opening—no applied badge, passes the filters, not seen this session
+        self.ledger.touch(card["jobID"] for card in cards)
+        jobIDs = []
+        for card in cards:
+            if not card["applied"]:
+                rule = self.filter.check(card)
+                if rule is not None:
+                    log.debug("Arya, filter '%s' rejected %s: %s", rule, card["jobID"], card.get("title"))
+                    self.metrics.inc("filter_hits", rule=rule)
+                    self.metrics.outcome("blacklisted", combo=self.combo, source="filter")
                 else:
-                    log.info(f"Arya, couldn’t apply to {jobID}")
-                jobIDs[jobID] = applied
+                    jobID = card["jobID"]
+                    if jobID == "search":
+                        log.debug("Arya, got 'search' instead of jobID: %s", card['text'])
+                        continue
+                    elif self.ledger.is_known(jobID):
+                        outcome = self.ledger.outcome(jobID)
+                        log.debug("Arya, %s is already in the ledger (%s)—skipping", jobID, outcome)
+                        self.metrics.inc("cache_hits", outcome=outcome)
+                        continue
+                    elif jobID in self.seen_jobs:
+                        log.debug("Arya, %s already came up in this session—skipping", jobID)
+                        continue
+                    else:
+                        self.seen_jobs.add(jobID)
+                        jobIDs.append(jobID)
+        return jobIDs
+
+    def prescreen_jobs(self, jobIDs) -> list:
+        # Arya: Fetching job pages concurrently over HTTP—blacklisted, non-Easy-Apply or applied jobs stop here
+        if not jobIDs:
+            return jobIDs
+        self.prescreener.sync_cookies(self.browser)
+        passed = []
+        for job in self.prescreener.fetch_all(jobIDs):
+            if job["applied"]:
+                reason, status, outcome = "already applied", AppliedLedger.APPLIED, "already_applied"
+            elif job["title"] and self.filter.check(dict(zip(("title", "company"), parse_title(job["title"])))):
+                reason, status, outcome = "blacklisted title", AppliedLedger.SKIPPED, "blacklisted"
+            elif job["easy_apply"] is False:
+                reason, status, outcome = "no Easy Apply", AppliedLedger.SKIPPED, "no_easy_apply"
+            else:
+                passed.append(job["jobID"])
+                continue
+            self.metrics.outcome(outcome, combo=self.combo, source="prescreen")
+            log.info(f"Arya, pre-screen skipped {job['jobID']} ({reason}): {job['title']}")
+            self.write_to_file(False, job["jobID"], job["title"], False)
+            title, company = parse_title(job["title"])
+            self.ledger.record(job["jobID"], status, outcome, title, company, job["easy_apply"])
+        return passed
 
+    def apply_one(self, jobID) -> bool:
+        # Arya: Claiming the job first so no other worker opens it at the same time
+        if not self.ledger.claim(jobID):
+            log.debug("Arya, %s was handled by another worker—skipping", jobID)
+            return False
+        try:
+            applied = self.apply_to_job(jobID)
+        finally:
+            self.ledger.release(jobID)
+        if applied:
+            log.info(f"Arya, applied to {jobID}")
+        else:
+            log.info(f"Arya, couldn’t apply to {jobID}")
+        return applied
+
+    @timed("apply")
     def apply_to_job(self, jobID):
         # Arya: Applying to a specific job—let’s do this!
         self.get_job_page(jobID)
-        time.sleep(1)
         button = self.get_easy_apply_button()
+        title: str = self.page.title
 
         if button is not False:
-            if any(word in self.browser.title for word in self.blackListTitles):
+            if self.filter.check(dict(zip(("title", "company"), parse_title(title)))):
                 log.info('Arya, skipping—found a blacklisted title')
                 string_easy = "* Contains blacklisted keyword"
                 result = False
+                status = AppliedLedger.SKIPPED
+                outcome = "blacklisted"
             else:
                 string_easy = "* has Easy Apply Button"
+                # Arya: After an Easy Apply limit there's no point opening the form—the job stays queued for next time
+                self.governor.check("submit")
                 log.info("Arya, clicking Easy Apply!")
                 button.click()
                 clicked = True
-                time.sleep(1)
+                self.waits.present(self.locator["modal"], "easy_apply_modal")
                 self.fill_out_fields()
                 result: bool = self.send_resume()
                 if result:
                     string_easy = "*Applied: Sent Resume"
+                    status = AppliedLedger.APPLIED
+                    outcome = "applied"
                 else:
                     string_easy = "*Did not apply: Failed to send Resume"
-        elif "You applied on" in self.browser.page_source:
+                    status = AppliedLedger.SEEN
+                    outcome = "failed"
+        elif self.page.contains("You applied on"):
             log.info("Arya, already applied to this job!")
             string_easy = "* Already Applied"
             result = False
+            status = AppliedLedger.APPLIED
+            outcome = "already_applied"
         else:
             log.info("Arya, no Easy Apply button found")
             string_easy = "* Doesn't have Easy Apply Button"
             result = False
+            status = AppliedLedger.SKIPPED
+            outcome = "no_easy_apply"
 
-        log.info(f"\nArya, Position {jobID}:\n {self.browser.title} \n {string_easy} \n")
-        self.write_to_file(button, jobID, self.browser.title, result)
+        log.info("Arya, position %s: %s %s", jobID, title, string_easy,
+                 extra={"jobID": jobID, "outcome": outcome, "combo": self.combo})
+        self.write_to_file(button, jobID, title, result)
+        self.ledger.record(jobID, status, outcome, *parse_title(title), easy_apply=button is not False)
+        self.metrics.outcome(outcome, combo=self.combo, source="browser")
         return result
 
     def write_to_file(self, button, jobID, browserTitle, result) -> None:
-        # Arya: Writing application details to our CSV file
-        def re_extract(text, pattern):
-            target = re.search(pattern, text)
-            if target:
-                target = target.group(1)
-            return target
-
+        # Arya: Handing the application details to our results writer
         timestamp: str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         attempted: bool = False if button == False else True
-        job = re_extract(browserTitle.split(' | ')[0], r"\(?\d?\)?\s?(\w.*)")
-        company = re_extract(browserTitle.split(' | ')[1], r"(\w.*)")
+        job, company = parse_title(browserTitle)
 
         toWrite: list = [timestamp, jobID, job, company, attempted, result]
-        with open(self.filename, 'a+') as f:
-            writer = csv.writer(f)
-            writer.writerow(toWrite)
+        self.results.write(toWrite)
 
+    @timed("get_job_page")
     def get_job_page(self, jobID):
         # Arya: Loading the job page we want to apply to
-        job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
-        self.browser.get(job)
+        job: str = self.base_url + '/jobs/view/' + str(jobID)
+        self.watchdog.navigated(self.governor.navigate(self.browser, job))
         self.job_page = self.load_page(sleep=0.5)
         return self.job_page
 
+    @timed("easy_apply_button")
     def get_easy_apply_button(self):
         # Arya: Looking for that Easy Apply button!
         EasyApplyButton = False
@@ -351,237 +2454,229 @@ class EasyApplyBot:
             for button in buttons:
                 if "Easy Apply" in button.text:
                     EasyApplyButton = button
-                    self.wait.until(EC.element_to_be_clickable(EasyApplyButton))
+                    self.waits.clickable(EasyApplyButton, "easy_apply_button")
                 else:
                     log.debug("Arya, no Easy Apply in this button")
         except Exception as e: 
-            log.debug(f"Arya, error finding Easy Apply: {str(e)}")
+            log.debug("Arya, error finding Easy Apply: %s", e)
         return EasyApplyButton
 
     def fill_out_fields(self):
-        # Arya: Filling out basic form fields like phone number
-        fields = self.browser.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-section__grouping")
-        for field in fields:
-            if "Mobile phone number" in field.text:
-                field_input = field.find_element(By.TAG_NAME, "input")
-                field_input.clear()
-                field_input.send_keys(self.phone_number)
+        # Arya: Filling out basic form fields like phone number—overwritten even when LinkedIn prefilled an old one
+        fills = [self.form_fill(field, str(self.phone_number)) for field in self.read_fields()
+                 if "mobile phone number" in field["label"].lower() and field["type"] == "text"]
+        fills = [fill for fill in fills if fill is not None]
+        if fills:
+            self.browser.execute_script(self.FORM_APPLY_JS, fills)
 
     def get_elements(self, type) -> list:
-        # Arya: Getting multiple elements from the page
-        elements = []
+        # Arya: Getting multiple elements from the page—find_elements is already empty when nothing matches
         element = self.locator[type]
-        if self.is_present(element):
-            elements = self.browser.find_elements(element[0], element[1])
-        return elements
+        return self.browser.find_elements(element[0], element[1])
+
+    def get_job_cards(self) -> list:
+        # Arya: Pulling ID, title, company, location and badges for every card with one execute_script
+        try:
+            return self.browser.execute_script(self.JOB_CARDS_JS) or []
+        except Exception as e:
+            log.debug("Arya, couldn’t read job cards: %s", e)
+            return []
 
     def is_present(self, locator):
         # Arya: Checking if an element is on the page
         return len(self.browser.find_elements(locator[0], locator[1])) > 0
 
+    @timed("send_resume")
     def send_resume(self) -> bool:
-        # Arya: Submitting the application with resume and cover letter
-        def is_present(button_locator) -> bool:
-            return len(self.browser.find_elements(button_locator[0], button_locator[1])) > 0
-
-        try:
-            next_locator = (By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
-            review_locator = (By.CSS_SELECTOR, "button[aria-label='Review your application']")
-            submit_locator = (By.CSS_SELECTOR, "button[aria-label='Submit application']")
-            error_locator = (By.CLASS_NAME, "artdeco-inline-feedback__message")
-            upload_resume_locator = (By.XPATH, '//span[text()="Upload resume"]')
-            upload_cv_locator = (By.XPATH, '//span[text()="Upload cover letter"]')
-            follow_locator = (By.CSS_SELECTOR, "label[for='follow-company-checkbox']")
-
-            submitted = False
-            loop = 0
-            while loop < 2:
-                time.sleep(1)
-                if is_present(upload_resume_locator):
-                    try:
-                        resume_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]")
-                        resume = self.uploads["Resume"]
-                        resume_locator.send_keys(resume)
-                        log.info("Arya, uploaded resume!")
-                    except Exception as e:
-                        log.error(f"Arya, resume upload failed: {str(e)}")
-                
-                if is_present(upload_cv_locator):
-                    cv = self.uploads["Cover Letter"]
-                    cv_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]")
-                    cv_locator.send_keys(cv)
-                    log.info("Arya, uploaded cover letter!")
-
-                elif len(self.get_elements("follow")) > 0:
-                    elements = self.get_elements("follow")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-                        log.info("Arya, clicked follow company!")
-
-                if len(self.get_elements("submit")) > 0:
-                    elements = self.get_elements("submit")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-                        log.info("Arya, application submitted!")
-                        submitted = True
-                        break
-
-                elif len(self.get_elements("error")) > 0:
-                    elements = self.get_elements("error")
-                    if "application was sent" in self.browser.page_source:
-                        log.info("Arya, application confirmed sent!")
-                        submitted = True
-                        break
-                    elif len(elements) > 0:
-                        while len(elements) > 0:
-                            log.info("Arya, questions detected—waiting 5s...")
-                            time.sleep(5)
-                            elements = self.get_elements("error")
-                            for element in elements:
-                                self.process_questions()
-                            if "application was sent" in self.browser.page_source:
-                                log.info("Arya, submitted after questions!")
-                                submitted = True
-                                break
-                            elif is_present(self.locator["easy_apply_button"]):
-                                log.info("Arya, skipping this one")
-                                submitted = False
-                                break
-                        continue
-
-                elif len(self.get_elements("next")) > 0:
-                    elements = self.get_elements("next")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-                        log.info("Arya, moving to next step!")
-
-                elif len(self.get_elements("review")) > 0:
-                    elements = self.get_elements("review")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-                        log.info("Arya, reviewing application!")
-
-                elif len(self.get_elements("follow")) > 0:
-                    elements = self.get_elements("follow")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-
-                loop += 1
-        except Exception as e:
-            log.error(f"Arya, submission error: {str(e)}")
-        return submitted
-
-    def process_questions(self):
-        # Arya: Handling extra questions in the application
-        time.sleep(1)
-        form = self.get_elements("fields")
-        for field in form:
-            question = field.text
-            answer = self.ans_question(question.lower())
-            if self.is_present(self.locator["radio_select"]):
-                try:
-                    input = field.find_element(By.CSS_SELECTOR, "input[type='radio'][value={}]".format(answer))
-                    input.execute_script("arguments[0].click();", input)
-                except Exception as e:
-                    log.error(f"Arya, radio button issue: {str(e)}")
-                    continue
-            elif self.is_present(self.locator["multi_select"]):
-                try:
-                    input = field.find_element(self.locator["multi_select"])
-                    input.send_keys(answer)
-                except Exception as e:
-                    log.error(f"Arya, multi-select issue: {str(e)}")
-                    continue
-            elif self.is_present(self.locator["text_select"]):
+        # Arya: Walking the Easy Apply form as a state machine—one DOM probe per step tells us where we are
+        submitted = False
+        last, repeats = None, 0
+        for step in range(self.form_step_limit):
+            started = time.perf_counter()
+            self.waits.settled("form_step")
+            self.page.invalidate()
+            self.waits.pace("action")
+            try:
+                probe = self.browser.execute_script(self.FORM_PROBE_JS)
+            except Exception as e:
+                log.error(f"Arya, couldn’t read the application form: {str(e)}")
+                break
+            state = probe["state"]
+            # Arya: The same step, same errors, three times in a row means we're not getting anywhere
+            fingerprint = (state, probe["heading"], tuple(probe["errors"]))
+            repeats = repeats + 1 if fingerprint == last else 0
+            last = fingerprint
+            if state == "sent":
+                log.info("Arya, application confirmed sent!")
+                submitted = True
+            elif state == "closed":
+                log.info("Arya, the application form went away without a confirmation")
+            elif state == "limited":
+                self.governor.throttled("application_limit")
+            elif repeats >= 2:
+                log.info(f"Arya, stuck on the '{state}' step—skipping this one")
+            else:
                 try:
-                    input = field.find_element(self.locator["text_select"])
-                    input.send_keys(answer)
+                    self.fill_form_step(probe)
+                except RateLimited:
+                    raise
                 except Exception as e:
-                    log.error(f"Arya, text input issue: {str(e)}")
-                    continue
-            elif self.is_present(self.locator["text_select"]):
-                pass
+                    log.error(f"Arya, submission error: {str(e)}")
+            self.metrics.observe("form_step", time.perf_counter() - started, combo=self.combo, state=state)
+            if state in ("sent", "closed", "limited") or repeats >= 2:
+                break
+        else:
+            log.info(f"Arya, gave up after {self.form_step_limit} form steps")
+        return submitted
 
-            if "Yes" or "No" in answer:
-                try:
-                    input = form.find_element(By.CSS_SELECTOR, "input[type='radio'][value={}]".format(answer))
-                    form.execute_script("arguments[0].click();", input)
-                except:
-                    pass
+    def fill_form_step(self, probe) -> None:
+        # Arya: Uploads, questions and follow first, then the one button that moves the form along
+        for kind, key in (("resume", "Resume"), ("cv", "Cover Letter")):
+            upload = probe["uploads"].get(kind)
+            if upload is None:
+                continue
+            if not self.uploads.get(key):
+                log.info(f"Arya, the form wants a {key.lower()} but none is configured")
+                continue
+            try:
+                upload.send_keys(self.uploads[key])
+                log.info(f"Arya, uploaded {key.lower()}!")
+            except Exception as e:
+                log.error(f"Arya, {key.lower()} upload failed: {str(e)}")
+        if probe["state"] in ("error", "questions"):
+            log.info("Arya, questions detected—filling them in")
+            self.process_questions()
+        if probe["follow"] is not None and probe["state"] == "submit":
+            probe["follow"].click()
+            log.info("Arya, clicked follow company!")
+        if probe["button"] is not None:
+            if probe["action"] == "submit":
+                self.governor.acquire("submit")
+            probe["button"].click()
+            log.info({"submit": "Arya, application submitted!", "review": "Arya, reviewing application!"}
+                     .get(probe["action"], "Arya, moving to next step!"))
+
+    @timed("questions")
+    def process_questions(self) -> list:
+        # Arya: Every field read in one script, answers worked out here, all of them written back in one more
+        fields = self.read_fields()
+        fills, problems = [], []
+        for field in fields:
+            if field["type"] == "none" or (field["value"] and not field["error"]):
+                continue
+            if field["error"]:
+                log.info(f"Arya, '{field['label']}' was rejected: {field['error']}")
+            answer = self.ans_question(field["label"].lower())
+            if answer is None or answer == AnswerStore.PLACEHOLDER:
+                continue  # Arya: Left for you to fill in by hand
+            fill = self.form_fill(field, str(answer))
+            if fill is None:
+                # Arya: Left empty rather than cut down to whatever digits we could find
+                problems.append((field["label"], f"'{answer}' isn't a number" if field["numeric"]
+                                 else f"no option matches '{answer}'"))
             else:
-                input = form.find_element(By.CLASS_NAME, "artdeco-text-input--input")
-                input.send_keys(answer)
+                fills.append(fill)
+        if fills:
+            results = self.browser.execute_script(self.FORM_APPLY_JS, fills) or []
+            problems += [(fields[fill["index"]]["label"], result) for fill, result in zip(fills, results) if result]
+        for label, problem in problems:
+            log.error(f"Arya, couldn’t answer '{label}': {problem}")
+        return problems
+
+    def read_fields(self) -> list:
+        try:
+            return self.browser.execute_script(self.FORM_FIELDS_JS) or []
+        except Exception as e:
+            log.error(f"Arya, couldn’t read the form fields: {str(e)}")
+            return []
+
+    @staticmethod
+    def form_fill(field, answer) -> dict | None:
+        # Arya: What FORM_APPLY_JS should do for one field—choices are matched to an option index, numbers cleaned up
+        fill = {"index": field["index"], "type": field["type"], "value": answer, "option": None}
+        if field["type"] in ("radio", "select", "checkbox"):
+            wanted = answer.strip().lower()
+            labels = [(option["label"] or option["value"]).strip().lower() for option in field["options"]]
+            # Arya: Prefixes must end on a word boundary and short answers never match inside a label—"no" is in "now"
+            prefix = re.compile(re.escape(wanted) + r"(?!\w)")
+            tiers = [lambda label: label == wanted, lambda label: prefix.match(label) is not None]
+            if len(wanted) > 3:
+                tiers.append(lambda label: wanted in label or (len(label) > 3 and label in wanted))
+            for matches in tiers:
+                fill["option"] = next((i for i, label in enumerate(labels)
+                                       if label != "select an option" and matches(label)), None)
+                if fill["option"] is not None:
+                    return fill
+            # Arya: A lone consent checkbox ("I agree ...") just needs ticking when the answer is yes
+            if field["type"] == "checkbox" and len(labels) == 1 and wanted in ("yes", "true", "agree"):
+                fill["option"] = 0
+                return fill
+            return None
+        if field["numeric"]:
+            number = EasyApplyBot.parse_number(answer)
+            if number is None:
+                return None
+            fill["value"] = number
+        return fill
+
+    @staticmethod
+    def parse_number(answer) -> str | None:
+        # Arya: "$100,000", "100 000", "100k USD" and "5 years" all become plain digits; None when there's no number
+        text = re.sub(r"(?<=\d)[,\s_](?=\d{3}\b)", "", str(answer).strip().lower())
+        text = re.sub(r"^(?:[$€£¥₹]|usd|cad|eur|gbp|inr)\s*", "", text)
+        match = re.match(r"(\d+(?:\.\d+)?)\s*([km])?(?![a-z])", text)
+        if match is None:
+            return None
+        value = float(match.group(1)) * {"k": 1000, "m": 1000000}.get(match.group(2), 1)
+        return str(int(value)) if value.is_integer() else str(round(value, 2))
+
 
     def ans_question(self, question):
-        # Arya: Auto-answering questions—basic logic here
-        answer = None
-        if "how many" in question:
-            answer = "1"
-        elif "experience" in question:
-            answer = "1"
-        elif "sponsor" in question:
-            answer = "No"
-        elif 'do you ' in question:
-            answer = "Yes"
-        elif "have you " in question:
-            answer = "Yes"
-        elif "US citizen" in question:
-            answer = "Yes"
-        elif "are you " in question:
-            answer = "Yes"
-        elif "salary" in question:
-            answer = self.salary
-        elif "can you" in question:
-            answer = "Yes"
-        elif "gender" in question:
-            answer = "Male"
-        elif "race" in question:
-            answer = "Wish not to answer"
-        elif "lgbtq" in question:
-            answer = "Wish not to answer"
-        elif "ethnicity" in question:
-            answer = "Wish not to answer"
-        elif "nationality" in question:
-            answer = "Wish not to answer"
-        elif "government" in question:
-            answer = "I do not wish to self-identify"
-        elif "are you legally" in question:
-            answer = "Yes"
+        # Arya: Auto-answering questions—your saved answer for this exact question, then our compiled keyword
+        # Arya: rules, then a saved answer to a reworded version of it
+        answer = self.answers.lookup(question, fuzzy=False)
+        if answer is not None:
+            log.debug("Arya, found a saved answer for '%s'", question)
         else:
+            answer = self.rules.answer(question, {"salary": self.salary, "rate": self.rate,
+                                                  "phone_number": self.phone_number})
+            if answer is None:
+                answer = self.answers.lookup(question)
+                if answer is not None:
+                    log.debug("Arya, found a saved answer to a reworded '%s'", question)
+        if answer is None:
             log.info("Arya, unknown question—please answer manually!")
-            answer = "user provided"
+            answer = AnswerStore.PLACEHOLDER
             time.sleep(15)
-
-        if question not in self.answers:
-            self.answers[question] = answer
-            new_data = pd.DataFrame({"Question": [question], "Answer": [answer]})
-            new_data.to_csv(self.qa_file, mode='a', header=False, index=False, encoding='utf-8')
-            log.info(f"Arya, saved '{question}' with '{answer}' to QA file")
+            # Arya: Only questions nobody could answer go to the QA file—rule answers would hide later rule edits
+            if question not in self.answers:
+                self.answers.add(question, answer)
+                log.info(f"Arya, saved '{question}' to the QA file for you to answer")
         log.info(f"Arya, answered '{question}' with '{answer}'")
         return answer
 
+    @timed("load_page")
     def load_page(self, sleep=1):
-        # Arya: Loading and scrolling the page to get all content
-        scroll_page = 0
-        while scroll_page < 4000:
-            self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
-            scroll_page += 500
-            time.sleep(sleep)
+        # Arya: Scrolling the page to get all content—each step moves on once lazy loading settles (max `sleep`s)
+        self.waits.scroll_through("load_page", end=4000, step=500, quiet=min(sleep, self.waits.quiet),
+                                  timeout=sleep * 8)
 
         if sleep != 1:
             self.browser.execute_script("window.scrollTo(0,0);")
-            time.sleep(sleep)
 
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+        # Arya: Nothing is fetched or parsed here—the snapshot does that if and when someone needs it
+        self.page.invalidate()
+        return self.page
 
     def avoid_lock(self) -> None:
-        # Arya: Preventing browser lock with fake mouse movements
+        # Arya: Preventing browser lock with fake mouse movements—headless (or no pyautogui) does it inside Chrome
+        if self.headless:
+            return self.keep_alive()
+        try:
+            import pyautogui
+        except Exception as e:
+            log.debug("Arya, pyautogui unavailable, keeping the session alive in-browser: %s", e)
+            return self.keep_alive()
         x, _ = pyautogui.position()
         pyautogui.moveTo(x + 200, pyautogui.position().y, duration=1.0)
         pyautogui.moveTo(x, pyautogui.position().y, duration=0.5)
@@ -591,26 +2686,74 @@ class EasyApplyBot:
         time.sleep(0.5)
         pyautogui.press('esc')
 
-    def next_jobs_page(self, position, location, jobs_per_page, experience_level=[]):
-        # Arya: Moving to the next page of jobs
+    def keep_alive(self) -> None:
+        # Arya: Same mouse wiggle and Escape presses, sent as trusted input events through DevTools—no sleeps
+        try:
+            self.browser.execute_cdp_cmd("Emulation.setFocusEmulationEnabled", {"enabled": True})
+            for x in (400, 600, 400):
+                self.browser.execute_cdp_cmd("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": 300})
+            for kind in ("keyDown", "keyUp"):
+                self.browser.execute_cdp_cmd("Input.dispatchKeyEvent", {
+                    "type": kind, "key": "Escape", "code": "Escape", "windowsVirtualKeyCode": 27})
+        except Exception as e:
+            log.debug("Arya, in-browser keep-alive failed: %s", e)
+
+    def jobs_search_url(self, position, location, jobs_per_page, experience_level=None) -> str:
+        # Arya: Building the search URL for one page of results
+        experience_level = self.experience_level if experience_level is None else experience_level
         experience_level_str = ",".join(map(str, experience_level)) if experience_level else ""
         experience_level_param = f"&f_E={experience_level_str}" if experience_level_str else ""
-        self.browser.get(
-            "https://www.linkedin.com/jobs/search/?f_LF=f_AL&keywords=" +
-            position + location + "&start=" + str(jobs_per_page) + experience_level_param)
-        self.avoid_lock()
-        log.info("Arya, loading next job page!")
-        self.load_page()
-        return (self.browser, jobs_per_page)
+        return (self.base_url + "/jobs/search/?f_LF=f_AL&keywords=" +
+                position + location + "&start=" + str(jobs_per_page) + experience_level_param)
+
+def run_workers(workers, bot_kwargs, positions, locations) -> None:
+    # Arya: N separate browsers, each with its own profile dir, pulling combos from one scheduler
+    shared = make_shared(bot_kwargs.get('filename', 'output.csv'), bot_kwargs.get('ledger_path', 'applied_jobs.db'),
+                         bot_kwargs.get('results'), bot_kwargs.get('qa_threshold', 0.8),
+                         bot_kwargs.get('checkpoint_path', 'checkpoint.jsonl'), bot_kwargs.get('metrics'),
+                         bot_kwargs.get('governor'), bot_kwargs.get('job_cache'))
+    combos = ComboScheduler(positions, locations, shared["ledger"], EasyApplyBot.MAX_SEARCH_TIME,
+                            checkpoint=shared["checkpoint"], **(bot_kwargs.get('combos') or {}))
+    base_profile = bot_kwargs.get('profile_path') or os.path.expanduser("~/.config/chrome-profile")
+    # Arya: Resolved once up front, so the workers all find it in the cache instead of racing to download it
+    resolve_driver_path(bot_kwargs.get('driver_cache', '.chromedriver_path'))
+
+    def work(number) -> None:
+        try:
+            # Arya: Chrome locks its profile dir, so worker 0 keeps yours and the rest get their own
+            profile = base_profile if number == 0 else f"{base_profile}-worker{number}"
+            bot = EasyApplyBot(**dict(bot_kwargs, profile_path=profile, shared=shared))
+            try:
+                bot.start_apply(positions, locations, combos=combos)
+            finally:
+                bot.browser.quit()
+        except Exception as e:
+            log.error(f"Arya, worker {number} stopped: {str(e)}")
+
+    threads = [threading.Thread(target=work, args=(number,), name=f"worker-{number}", daemon=True)
+               for number in range(workers)]
+    log.info(f"Arya, starting {workers} workers for {len(positions) * len(locations)} combos")
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if shared["checkpoint"] is not None and combos.drained:
+            shared["checkpoint"].run_done()
+    finally:
+        shared["results"].close()
+        shared["answers"].flush()
 
 if __name__ == '__main__':
-    # Arya: Loading your config file—let’s get started!
+    # Arya: Loading your config file—let’s get started! Logging starts here, not on import
+    import yaml
     with open("config.yaml", 'r') as stream:
         try:
             parameters = yaml.safe_load(stream)
         except yaml.YAMLError as exc:
             log.error(f"Arya, couldn’t load config.yaml: {str(exc)}")
             raise exc
+    setupLogger(parameters.get('logging'))
 
     # Arya: Checking required fields
     required_fields = ['positions', 'locations', 'username', 'password', 'phone_number']
@@ -624,8 +2767,9 @@ if __name__ == '__main__':
     log.info({k: parameters[k] for k in parameters.keys() if k not in ['username', 'password']})
 
     # Arya: Setting defaults for optional fields
-    output_filename: list = [f for f in parameters.get('output_filename', ['output.csv']) if f is not None]
-    output_filename: list = output_filename[0] if len(output_filename) > 0 else 'output.csv'
+    output_filename = parameters.get('output_filename') or 'output.csv'
+    if isinstance(output_filename, list):
+        output_filename = next((f for f in output_filename if f is not None), 'output.csv')
     blacklist = parameters.get('blacklist', [])
     blackListTitles = parameters.get('blackListTitles', [])
     uploads = {} if parameters.get('uploads', {}) is None else parameters.get('uploads', {})
@@ -637,17 +2781,46 @@ if __name__ == '__main__':
     positions: list = [p for p in parameters['positions'] if p is not None]
 
     # Arya: Starting the bot with all parameters—profile_path is optional now!
-    bot = EasyApplyBot(
-        parameters['username'],
-        parameters['password'],
-        parameters['phone_number'],
-        parameters.get('profile_path'),  # Optional, defaults to None
-        parameters.get('salary'),        # Optional
-        parameters.get('rate'),          # Optional
+    bot_kwargs = dict(
+        username=parameters['username'],
+        password=parameters['password'],
+        phone_number=parameters['phone_number'],
+        profile_path=parameters.get('profile_path'),  # Optional, defaults to None
+        salary=parameters.get('salary'),              # Optional
+        rate=parameters.get('rate'),                  # Optional
         uploads=uploads,
         filename=output_filename,
         blacklist=blacklist,
         blackListTitles=blackListTitles,
-        experience_level=parameters.get('experience_level', [])
+        experience_level=parameters.get('experience_level', []),
+        ledger_path=parameters.get('ledger_path') or 'applied_jobs.db',
+        results=parameters.get('results') or {},
+        qa_threshold=parameters.get('qa_match_threshold', 0.8),
+        question_rules=parameters.get('question_rules'),  # Optional, built-in rules when missing
+        waits=parameters.get('waits') or {},
+        pipeline=parameters.get('pipeline') or {},
+        prescreen=parameters.get('prescreen') or {},
+        checkpoint_path=parameters.get('checkpoint_path', 'checkpoint.jsonl'),  # Empty turns resuming off
+        cookies_path=parameters.get('cookies_path', 'linkedin_cookies.json'),
+        driver_cache=parameters.get('driver_cache', '.chromedriver_path'),
+        browser=parameters.get('browser') or {},
+        base_url=parameters.get('base_url') or 'https://www.linkedin.com',  # Optional, for a local stand-in site
+        metrics=parameters.get('metrics') or {},
+        form_step_limit=parameters.get('form_step_limit', 15),
+        filters=parameters.get('filters'),  # Optional, on top of blacklist and blackListTitles
+        governor=parameters.get('governor') or {},
+        watchdog=parameters.get('watchdog') or {},
+        job_cache=parameters.get('job_cache') or {},
+        combos=parameters.get('combos') or {}
     )
-    bot.start_apply(positions, locations)
+    # Arya: Turning SIGTERM into a normal exit so buffered results get flushed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    workers = int(parameters.get('workers') or 1)
+    if workers > 1:
+        run_workers(workers, bot_kwargs, positions, locations)
+    else:
+        bot = EasyApplyBot(**bot_kwargs)
+        try:
+            bot.start_apply(positions, locations)
+        finally:
+            bot.results.close()
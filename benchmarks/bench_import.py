@@ -0,0 +1,49 @@
+# Arya: Import-time check for Bot.py—run with `python benchmarks/bench_import.py [budget_ms]`
+# Exits non-zero if importing gets slower than the budget, pulls in a heavy module or touches the disk.
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+HEAVY = ["pandas", "pyautogui", "bs4", "lxml", "requests", "webdriver_manager",
+         "selenium.webdriver.remote.webdriver", "selenium.webdriver.support.ui"]
+PROBE = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import Bot
+print((time.perf_counter() - start) * 1000)
+print(",".join(name for name in sys.argv[2].split(",") if name in sys.modules))
+"""
+
+
+def measure(workdir) -> tuple:
+    output = subprocess.run([sys.executable, "-c", PROBE, ROOT, ",".join(HEAVY)], cwd=workdir,
+                            capture_output=True, text=True, check=True).stdout.splitlines()
+    return float(output[0]), [name for name in output[1].split(",") if name]
+
+
+def main(budget_ms=150.0, runs=5) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        times = []
+        for _ in range(runs):
+            elapsed, loaded = measure(workdir)
+            times.append(elapsed)
+        created = os.listdir(workdir)
+    best = min(times)
+    print(f"import Bot: best {best:.1f} ms, median {sorted(times)[len(times) // 2]:.1f} ms over {runs} runs")
+    problems = []
+    if best > budget_ms:
+        problems.append(f"slower than the {budget_ms:.0f} ms budget")
+    if loaded:
+        problems.append(f"heavy modules imported eagerly: {', '.join(loaded)}")
+    if created:
+        problems.append(f"files created on import: {', '.join(created)}")
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main(*map(float, sys.argv[1:2]))
@@ -0,0 +1,46 @@
+# Arya: Micro-benchmark for QuestionRules—run with `python benchmarks/bench_question_rules.py [qa.csv]`
+import csv
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from Bot import QuestionRules
+
+
+def naive_answer(rules, question):
+    # Arya: What ans_question used to do—test every keyword in order
+    for rule in sorted(rules, key=lambda r: r.get("priority", 0)):
+        keywords = rule["match"] if isinstance(rule["match"], list) else [rule["match"]]
+        if any(k in question for k in keywords):
+            return rule["answer"]
+    return None
+
+
+def timed(fn, questions, repeat) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for question in questions:
+            fn(question)
+    return (time.perf_counter() - start) / (repeat * len(questions)) * 1e6
+
+
+def main(qa_path="qa.csv", repeat=200) -> None:
+    with open(qa_path, newline='', encoding='utf-8') as f:
+        questions = [row["Question"].lower() for row in csv.DictReader(f) if row.get("Question")]
+    if not questions:
+        sys.exit(f"Arya, no questions in {qa_path}")
+
+    print(f"{len(questions)} questions from {qa_path}")
+    for count in (len(QuestionRules.DEFAULT_RULES), 100, 500):
+        # Arya: Padding the rule table with keywords that never match to see how cost grows
+        rules = list(QuestionRules.DEFAULT_RULES)
+        rules += [{"match": f"zz keyword {i} zz", "answer": "No", "priority": 100 + i}
+                  for i in range(max(0, count - len(rules)))]
+        compiled = QuestionRules(rules)
+        print(f"{len(rules):>4} rules: compiled {timed(compiled.answer, questions, repeat):7.2f} us/question, "
+              f"naive {timed(lambda q: naive_answer(rules, q), questions, repeat):7.2f} us/question")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
@@ -0,0 +1,184 @@
+# Arya: End-to-end benchmark—drives EasyApplyBot.start_apply against the offline replay site, no network needed
+# Arya: Run with `python benchmarks/bench_replay.py [--jobs 60] [--locations 2] [--latency 0.05] [--json out.json]`
+# Arya: --prescreen turns on HTTP pre-screening and checks its verdicts against the site; --throttle-every adds 429s
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import Bot
+from replay_site import ReplaySite
+
+# Arya: Bot methods timed per call—the pipeline's page read lives on JobPipeline, so it's timed there
+STAGES = ["get_job_page", "load_page", "get_easy_apply_button", "fill_out_fields", "send_resume",
+          "process_questions", "apply_to_job"]
+
+
+class Probe:
+    # Arya: Per-stage latencies and WebDriver commands, attached to one bot without touching Bot.py
+    def __init__(self) -> None:
+        self.latency: dict = defaultdict(list)
+        self.commands: dict = defaultdict(int)
+        self.screened: list = []
+
+    def timed(self, name, method):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.latency[name].append(time.perf_counter() - started)
+        return wrapper
+
+    def attach(self, bot) -> None:
+        for name in STAGES:
+            setattr(bot, name, self.timed(name, getattr(bot, name)))
+        # Arya: Every Selenium call is one execute()—one HTTP round trip to chromedriver
+        execute = bot.browser.execute
+
+        def counted(command, params=None):
+            self.commands[command] += 1
+            return execute(command, params)
+        bot.browser.execute = counted
+        collect_page = Bot.JobPipeline.collect_page
+        probe = self
+
+        def timed_collect(pipeline):
+            started = time.perf_counter()
+            try:
+                return collect_page(pipeline)
+            finally:
+                probe.latency["collect_page"].append(time.perf_counter() - started)
+        Bot.JobPipeline.collect_page = timed_collect
+        if bot.prescreener is not None:
+            fetch_all = bot.prescreener.fetch_all
+
+            def screened(jobIDs):
+                started = time.perf_counter()
+                jobs = fetch_all(jobIDs)
+                probe.latency["prescreen_batch"].append(time.perf_counter() - started)
+                probe.screened.extend(jobs)
+                return jobs
+            bot.prescreener.fetch_all = screened
+
+
+def prescreen_report(site, screened) -> dict:
+    # Arya: Pre-screen verdicts against what the site actually serves—unknown is fine after a 429, wrong never is
+    counts = {"fetched": len(screened), "easy_apply": 0, "offsite": 0, "applied": 0, "unknown": 0, "wrong": 0}
+    for job in screened:
+        truth = site.job(int(job["jobID"]))
+        if job["applied"]:
+            verdict, right = "applied", truth["applied"]
+        elif job["easy_apply"] is None:
+            verdict, right = "unknown", True
+        elif job["easy_apply"]:
+            verdict, right = "easy_apply", truth["easy"]
+        else:
+            verdict, right = "offsite", not truth["easy"]
+        counts[verdict] += 1
+        counts["wrong"] += not right
+    return counts
+
+
+def percentile(values, fraction) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark EasyApplyBot against the local replay site")
+    parser.add_argument("--jobs", type=int, default=60, help="jobs per search combo")
+    parser.add_argument("--pool", type=int, default=200, help="distinct job IDs shared by all combos")
+    parser.add_argument("--positions", type=int, default=1, choices=range(1, 5), help="positions to search")
+    parser.add_argument("--locations", type=int, default=2, choices=range(1, 4), help="locations to search")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every HTTP response")
+    parser.add_argument("--render-delay", type=int, default=150, help="ms the site takes to render each form step")
+    parser.add_argument("--pacing", action="store_true", help="keep the default human-looking pauses")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--prescreen", action="store_true", help="pre-screen job pages over HTTP before opening them")
+    parser.add_argument("--throttle-every", type=int, default=0, help="answer every Nth job page with a 429")
+    parser.add_argument("--driver-cache", default=os.path.abspath(".chromedriver_path"))
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    site = ReplaySite(args.jobs, args.pool, args.latency, args.render_delay, throttle_every=args.throttle_every)
+    server = site.serve()
+    workdir = tempfile.mkdtemp(prefix="bench_replay_")
+    json_path = os.path.abspath(args.json) if args.json else None
+    os.chdir(workdir)  # Arya: qa.csv, the ledger and results all land in the scratch dir
+    resume = os.path.join(workdir, "resume.pdf")
+    with open(resume, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+
+    started = time.perf_counter()
+    bot = Bot.EasyApplyBot(
+        "replay", "replay", "5555555555", profile_path=os.path.join(workdir, "profile"), salary="100000",
+        uploads={"Resume": resume}, filename=os.path.join(workdir, "output.csv"),
+        ledger_path=os.path.join(workdir, "applied.db"), checkpoint_path="", cookies_path="",
+        driver_cache=args.driver_cache, base_url=f"http://127.0.0.1:{server.server_port}",
+        waits=None if args.pacing else {"pacing": {"page": [0, 0], "action": [0, 0]}},
+        browser={"headless": not args.headed}, prescreen={"enabled": args.prescreen},
+        # Arya: No caps—a cap would end the run early with partial numbers—and short backoffs for --throttle-every
+        governor={"page_views_per_hour": 0, "page_views_per_day": 0,
+                  "submissions_per_hour": 0, "submissions_per_day": 0, "backoff_base": 1, "backoff_max": 5})
+    startup = time.perf_counter() - started
+    probe = Probe()
+    probe.attach(bot)
+    positions = ["Software Engineer", "Data Scientist", "Backend Developer", "Data Engineer"][:args.positions]
+    locations = ["Remote", "Canada", "United States"][:args.locations]
+    try:
+        started = time.perf_counter()
+        bot.start_apply(positions, locations)
+        elapsed = time.perf_counter() - started
+        chrome_rss = Bot.process_tree_rss(bot.browser.service.process.pid) or 0
+    finally:
+        bot.results.close()
+        bot.browser.quit()
+        server.shutdown()
+
+    processed = len(probe.latency["apply_to_job"])
+    report = {
+        "startup_seconds": round(startup, 2),
+        "run_seconds": round(elapsed, 2),
+        "jobs_processed": processed,
+        "applications_sent": site.stats["submitted"],
+        "jobs_per_hour": round(processed / elapsed * 3600, 1) if elapsed else 0.0,
+        "applications_per_hour": round(site.stats["submitted"] / elapsed * 3600, 1) if elapsed else 0.0,
+        "webdriver_commands": sum(probe.commands.values()),
+        "webdriver_commands_per_job": round(sum(probe.commands.values()) / max(processed, 1), 1),
+        "top_commands": dict(sorted(probe.commands.items(), key=lambda item: -item[1])[:8]),
+        "stages": {name: {"calls": len(times), "avg_ms": round(sum(times) / len(times) * 1000, 1),
+                          "p50_ms": round(percentile(times, 0.5) * 1000, 1),
+                          "p95_ms": round(percentile(times, 0.95) * 1000, 1)}
+                   for name, times in sorted(probe.latency.items()) if times},
+        "python_peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "chrome_rss_mib": round(chrome_rss / 2 ** 20, 1),
+        "site": site.stats,
+        "throttle_signals": {dict(labels).get("signal"): count for (name, labels), count in bot.metrics.counters.items()
+                             if name == "throttled"},
+    }
+    if bot.prescreener is not None:
+        report["prescreen"] = prescreen_report(site, probe.screened)
+    print(f"Processed {processed} jobs ({site.stats['submitted']} applications) in {elapsed:.1f}s—"
+          f"{report['jobs_per_hour']} jobs/hour, {report['webdriver_commands_per_job']} WebDriver commands per job")
+    for name, stage in report["stages"].items():
+        print(f"  {name:<22} {stage['calls']:>5} calls  avg {stage['avg_ms']:>8.1f} ms  "
+              f"p50 {stage['p50_ms']:>8.1f} ms  p95 {stage['p95_ms']:>8.1f} ms")
+    print(f"  memory: python peak {report['python_peak_rss_mib']} MiB, chrome {report['chrome_rss_mib']} MiB")
+    if "prescreen" in report:
+        print("  prescreen: " + ", ".join(f"{key} {value}" for key, value in report["prescreen"].items()))
+    if site.stats["throttled"]:
+        print(f"  throttling: {site.stats['throttled']} 429s served, signals seen {report['throttle_signals']}")
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+# Arya: Offline stand-in for the LinkedIn pages the bot touches—run with `python benchmarks/replay_site.py [port]`
+# Arya: Login, search results that lazy-load as you scroll, job pages and multi-step Easy Apply forms, all local
+import html
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+TITLES = ["Software Engineer", "Senior Software Engineer", "Data Scientist", "Backend Developer",
+          "Machine Learning Engineer", "Platform Engineer", "Data Engineer", "Full Stack Developer"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Pied Piper"]
+QUESTIONS = [
+    ("How many years of experience do you have with Python?", "text"),
+    ("Are you legally authorized to work in the United States?", "radio"),
+    ("Will you now or in the future require sponsorship for employment visa status?", "radio"),
+    ("What are your salary expectations?", "text"),
+]
+# Arya: Which Easy Apply flow a job gets—None means the job only has "Apply on company website"
+FLOWS = [None,
+         ["contact"],
+         ["contact", "resume", "review"],
+         ["contact", "resume", "questions", "review"]]
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>body {{ font-family: sans-serif; }} .jobs-search-results-list {{ height: 600px; overflow-y: auto; }}
+div[data-job-id] {{ height: 120px; border-bottom: 1px solid #ddd; }}
+.jobs-easy-apply-modal {{ position: fixed; top: 10%; left: 25%; width: 50%; background: #fff; border: 1px solid #999; }}
+</style></head>
+<body>{body}</body></html>"""
+
+LOGIN = """<div id="organic-div"><form method="post" action="/login">
+<div><input id="username" name="session_key"></div>
+<div><input id="password" name="session_password" type="password"></div>
+<div><button type="submit">Sign in</button></div>
+</form></div>"""
+
+SEARCH_JS = """<script>
+var cards = %s, shown = 0, list = document.querySelector('.jobs-search-results-list');
+function card(job) {
+    var div = document.createElement('div');
+    div.setAttribute('data-job-id', job.id);
+    div.innerHTML = '<a class="job-card-list__title" href="/jobs/view/' + job.id + '/">' + job.title + '</a>' +
+        '<div class="artdeco-entity-lockup__subtitle">' + job.company + '</div>' +
+        '<div class="artdeco-entity-lockup__caption">' + job.location + '</div>' +
+        '<ul><li>' + (job.applied ? 'Applied' : 'Promoted') + '</li>' + (job.easy ? '<li>Easy Apply</li>' : '') + '</ul>';
+    return div;
+}
+// Like the real list, only the first few cards exist until the list is scrolled
+function more(count) {
+    for (var end = Math.min(shown + count, cards.length); shown < end; shown++) { list.appendChild(card(cards[shown])); }
+}
+more(7);
+list.addEventListener('scroll', function () { setTimeout(function () { more(6); }, %d); });
+</script>"""
+
+JOB_JS = """<script>
+var job = %s, step = 0, delay = %d, modal = null;
+function field(label, input) {
+    return '<div class="jobs-easy-apply-form-section__grouping"><label>' + label + '</label>' + input + '</div>';
+}
+function button(label, text) { return '<button aria-label="' + label + '" onclick="advance()">' + text + '</button>'; }
+function render() {
+    var kind = job.flow[step], body = '';
+    if (kind === 'contact') {
+        body = field('Mobile phone number', '<input class="artdeco-text-input--input" type="text">');
+    } else if (kind === 'resume') {
+        body = '<span>Upload resume</span><input id="jobs-document-upload-file-input-upload-resume" type="file">';
+    } else if (kind === 'questions') {
+        job.questions.forEach(function (q, i) {
+            var input = q[1] === 'radio'
+                ? '<input type="radio" name="q' + i + '" value="Yes">Yes <input type="radio" name="q' + i + '" value="No">No'
+                : '<input class="artdeco-text-input--input" type="text" name="q' + i + '">';
+            body += field(q[0], input);
+        });
+    } else if (kind === 'review') {
+        body = '<input id="follow-company-checkbox" type="checkbox" checked><label for="follow-company-checkbox">Follow</label>';
+    }
+    var next = job.flow[step + 1];
+    body += next === undefined ? button('Submit application', 'Submit')
+        : next === 'review' ? button('Review your application', 'Review')
+        : button('Continue to next step', 'Next');
+    modal.innerHTML = '<h2>Apply to ' + job.company + '</h2>' + body;
+}
+function missing() {
+    return Array.prototype.filter.call(modal.querySelectorAll('.jobs-easy-apply-form-section__grouping'), function (group) {
+        var radios = group.querySelectorAll('input[type=radio]');
+        if (radios.length) { return !Array.prototype.some.call(radios, function (r) { return r.checked; }); }
+        var text = group.querySelector('input[type=text]');
+        return text && !text.value;
+    });
+}
+function advance() {
+    var empty = missing();
+    if (empty.length) {
+        empty.forEach(function (group) {
+            if (!group.querySelector('.artdeco-inline-feedback__message')) {
+                group.insertAdjacentHTML('beforeend',
+                    '<span class="artdeco-inline-feedback__message">Please enter a valid answer</span>');
+            }
+        });
+        return;
+    }
+    modal.innerHTML = '<p>Loading...</p>';
+    if (step === job.flow.length - 1) {
+        fetch('/replay/submit/' + job.id, {method: 'POST'}).then(function () {
+            setTimeout(function () { modal.innerHTML = '<h2>Your application was sent to ' + job.company + '!</h2>'; }, delay);
+        });
+        return;
+    }
+    step++;
+    setTimeout(render, delay);
+}
+function openModal() {
+    modal = document.createElement('div');
+    modal.className = 'jobs-easy-apply-modal';
+    document.body.appendChild(modal);
+    setTimeout(render, delay);
+}
+</script>"""
+
+
+class ReplaySite:
+    # Arya: Everything is derived from the job ID, so two runs with the same settings see the same site
+    def __init__(self, jobs_per_search=60, pool=200, latency=0.05, render_delay=150, seed=1, throttle_every=0) -> None:
+        self.jobs_per_search = jobs_per_search
+        self.pool = pool
+        self.latency = latency
+        self.render_delay = render_delay
+        self.seed = seed
+        # Arya: Every Nth job page is an empty 429, like LinkedIn when it wants us to slow down—0 never throttles
+        self.throttle_every = throttle_every
+        self.lock = threading.Lock()
+        self.stats: dict = {"requests": 0, "searches": 0, "job_pages": 0, "submitted": 0, "throttled": 0}
+        self.submitted: set = set()
+
+    def job(self, jobID) -> dict:
+        rng = random.Random(jobID * 31 + self.seed)
+        flow = FLOWS[rng.randrange(len(FLOWS))]
+        return {
+            "id": jobID,
+            "title": rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(["Remote", "New York, NY", "Toronto, ON", "Austin, TX"]),
+            "easy": flow is not None,
+            "flow": flow,
+            "questions": rng.sample(QUESTIONS, 3),
+            "applied": jobID in self.submitted or rng.random() < 0.05,
+        }
+
+    def search(self, keywords, location, start) -> list:
+        # Arya: Each search sees its own slice of a shared pool, so different combos overlap like the real thing
+        rng = random.Random(zlib.crc32(f"{keywords}|{location}".encode()) + self.seed)
+        ids = rng.sample(range(self.pool), min(self.jobs_per_search, self.pool))
+        return [self.job(3900000000 + number) for number in ids[start:start + 25]]
+
+    def page(self, title, body) -> str:
+        return PAGE.format(title=html.escape(title), body=body)
+
+    def handle(self, method, path, query, cookies) -> tuple:
+        # Arya: Returns (status, headers, body) for one request
+        with self.lock:
+            self.stats["requests"] += 1
+        logged_in = "li_at=replay" in cookies
+        if path == "/login" and method == "POST":
+            return 302, {"Location": "/feed/", "Set-Cookie": "li_at=replay; Path=/"}, ""
+        if path == "/login":
+            return 200, {}, self.page("LinkedIn Login", LOGIN)
+        if path.startswith("/replay/submit/") and method == "POST":
+            with self.lock:
+                self.submitted.add(int(path.rsplit("/", 1)[1]))
+                self.stats["submitted"] += 1
+            return 204, {}, ""
+        if path == "/replay/stats":
+            with self.lock:
+                return 200, {"Content-Type": "application/json"}, json.dumps(self.stats)
+        if not logged_in:
+            return 302, {"Location": "/login"}, ""
+        if path.startswith("/feed"):
+            return 200, {}, self.page("Feed | LinkedIn", "<h1>Feed</h1>")
+        if path.startswith("/jobs/search"):
+            with self.lock:
+                self.stats["searches"] += 1
+            cards = self.search(query.get("keywords", [""])[0], query.get("location", [""])[0],
+                                int(query.get("start", ["0"])[0] or 0))
+            body = '<div class="jobs-search-results-list"></div>' + SEARCH_JS % (json.dumps(cards), self.render_delay)
+            return 200, {}, self.page("Jobs | LinkedIn", body)
+        if path.startswith("/jobs/view/"):
+            with self.lock:
+                self.stats["job_pages"] += 1
+                throttled = self.throttle_every and self.stats["job_pages"] % self.throttle_every == 0
+                if throttled:
+                    self.stats["throttled"] += 1
+            if throttled:
+                return 429, {}, ""
+            job = self.job(int(path.strip("/").rsplit("/", 1)[1]))
+            if job["applied"]:
+                action = "<p>You applied on LinkedIn</p>"
+            elif job["easy"]:
+                action = '<button class="jobs-apply-button artdeco-button" onclick="openModal()">Easy Apply</button>'
+            else:
+                action = '<a class="apply-link-offsite">Apply on company website</a>'
+            body = (f"<h1>{html.escape(job['title'])}</h1><p>{html.escape(job['company'])}</p>{action}"
+                    + "<p>Job description.</p>" * 40 + JOB_JS % (json.dumps(job), self.render_delay))
+            return 200, {}, self.page(f"{job['title']} | {job['company']} | LinkedIn", body)
+        return 404, {}, self.page("Not found", "<h1>404</h1>")
+
+    def serve(self, port=0) -> ThreadingHTTPServer:
+        # Arya: Starts the server on a background thread and hands it back—server.server_port has the port
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def respond(self, method) -> None:
+                url = urlparse(self.path)
+                if site.latency:
+                    time.sleep(site.latency)
+                status, headers, body = site.handle(method, url.path, parse_qs(url.query),
+                                                    self.headers.get("Cookie", ""))
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", headers.pop("Content-Type", "text/html; charset=utf-8"))
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                self.respond("GET")
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                self.respond("POST")
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        threading.Thread(target=server.serve_forever, name="replay-site", daemon=True).start()
+        return server
+
+
+if __name__ == '__main__':
+    server = ReplaySite().serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8000)
+    print(f"Replay site on http://127.0.0.1:{server.server_port}—log in with anything, Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()